@@ -10,6 +10,13 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
+try:
+    import orjson  # type: ignore
+    ORJSON_AVAILABLE = True
+except ImportError:
+    # Fallback to stdlib json if orjson is not installed
+    ORJSON_AVAILABLE = False
+
 # Load environment variables
 load_dotenv()
 
@@ -18,8 +25,9 @@ logger = logging.getLogger('Config')
 
 class Config:
     """Configuration manager for the bot"""
-    def __init__(self, config_path: str = 'data/settings.json'):
+    def __init__(self, config_path: str = 'data/settings.json', use_orjson: bool = True):
         self.config_path = Path(config_path)
+        self.use_orjson = use_orjson and ORJSON_AVAILABLE
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
         # Load API credentials from environment
         api_id_str = os.getenv('API_ID', '0')
@@ -44,6 +52,7 @@ class Config:
                 'messages_mirrored': 0,
                 'media_mirrored': 0,
                 'errors': 0,
+                'dropped': 0,
                 'start_time': None
             },
             'options': {
@@ -54,12 +63,20 @@ class Config:
                 'mirror_deletes': True,
                 'bypass_restriction': True,
                 'cache_media': False,
-                'allow_all_users': True  # If True, all users can use commands
+                'allow_all_users': True,  # If True, all users can use commands
+                'silent': False,  # Send mirrored messages without notification
+                'max_parallel_targets': 8,  # Max concurrent sends across target chats
+                'rate_per_chat': 1.0,  # Max sustained sends per second to one target chat
+                'burst_per_chat': 5  # Sends allowed back-to-back before pacing kicks in
             },
             'log_channel': os.getenv('LOG_CHANNEL_ID', None)
         }
 
         self._config = self.load()
+        # Bumped on every channel-routing change so callers can drop cached lookups
+        self.version = 0
+        # Bumped on every option change, for callers that snapshot options
+        self.options_version = 0
         # Ensure API credentials and session are always from environment
         self._config['api_id'] = self._api_id
         self._config['api_hash'] = self._api_hash
@@ -72,9 +89,10 @@ class Config:
         """Load configuration from file"""
         if self.config_path.exists():
             try:
-                with open(self.config_path, encoding='utf-8') as f:
-                    config = json.load(f)
-                    return {**self._default_config, **config}
+                with open(self.config_path, 'rb') as f:
+                    data = f.read()
+                config = orjson.loads(data) if self.use_orjson else json.loads(data)
+                return {**self._default_config, **config}
             except (json.JSONDecodeError, OSError) as e:
                 logger.error("Failed to load config: %s", e)
 
@@ -83,13 +101,24 @@ class Config:
     def save(self) -> bool:
         """Save configuration to file"""
         try:
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self._config, f, indent=2, ensure_ascii=False)
+            data = self._serialize()
+            with open(self.config_path, 'wb') as f:
+                f.write(data)
             return True
         except OSError as e:
             logger.error("Failed to save config: %s", e)
             return False
 
+    def _serialize(self) -> bytes:
+        """Serialize configuration to UTF-8 JSON bytes"""
+        if self.use_orjson:
+            try:
+                return orjson.dumps(self._config, option=orjson.OPT_INDENT_2)
+            except TypeError as e:
+                # orjson rejects non-str keys - stdlib json coerces them
+                logger.debug("orjson serialization failed, using json: %s", e)
+        return json.dumps(self._config, indent=2, ensure_ascii=False).encode('utf-8')
+
     @property
     def api_id(self) -> int:
         """Get API ID"""
@@ -130,6 +159,7 @@ class Config:
             return False
 
         self._config['channel_mappings'][source_str] = target_str
+        self.version += 1
         self.save()
         if target:
             logger.info("Added mapping: %s → %s", source, target)
@@ -145,6 +175,7 @@ class Config:
             return False
 
         del self._config['channel_mappings'][source_str]
+        self.version += 1
         self.save()
         logger.info("Removed mapping for %s", source)
         return True
@@ -165,6 +196,7 @@ class Config:
     def clear_mappings(self):
         """Clear all mappings"""
         self._config['channel_mappings'] = {}
+        self.version += 1
         self.save()
         logger.info("Cleared all mappings")
 
@@ -172,7 +204,18 @@ class Config:
         """Cache message ID mapping for edits/deletes"""
         key = f"{source_chat}_{source_msg_id}"
         self._config['message_cache'][key] = target_msg_id
-
+        self._trim_message_cache()
+
+    def cache_messages_bulk(self, mappings: list[tuple[int, int, int]]):
+        """Cache several (source_msg_id, target_msg_id, source_chat) mappings at once"""
+        self._config['message_cache'].update(
+            (f"{source_chat}_{source_msg_id}", target_msg_id)
+            for source_msg_id, target_msg_id, source_chat in mappings
+        )
+        self._trim_message_cache()
+
+    def _trim_message_cache(self):
+        """Drop the oldest entries once the cache exceeds 10,000 mappings"""
         if len(self._config['message_cache']) > 10000:
             keys = list(self._config['message_cache'].keys())
             for k in keys[:1000]:
@@ -183,11 +226,28 @@ class Config:
         key = f"{source_chat}_{source_msg_id}"
         return self._config['message_cache'].get(key)
 
+    def get_cached_ids(self, source_chat: int) -> set[int]:
+        """Source message IDs with a cached mapping for one chat"""
+        prefix = f"{source_chat}_"
+        return {
+            int(key[len(prefix):])
+            for key in self._config['message_cache']
+            if key.startswith(prefix)
+        }
+
     def update_stats(self, stat: str, increment: int = 1):
         """Update statistics"""
-        if stat in self._config['stats']:
-            self._config['stats'][stat] += increment
-            self.save()
+        stats = self._config['stats']
+        # Counters added after a settings file was created start from zero
+        stats[stat] = stats.get(stat, 0) + increment
+        self.save()
+
+    def update_stats_bulk(self, counts: dict[str, int]):
+        """Apply several stat increments with a single save"""
+        stats = self._config['stats']
+        for stat, increment in counts.items():
+            stats[stat] = stats.get(stat, 0) + increment
+        self.save()
 
     def get_stats(self) -> dict:
         """Get bot statistics"""
@@ -201,6 +261,7 @@ class Config:
             'edits_mirrored': 0,
             'deletes_mirrored': 0,
             'errors': 0,
+            'dropped': 0,
             'start_time': None
         }
         self.save()
@@ -209,10 +270,16 @@ class Config:
         """Get option value"""
         return self._config['options'].get(option, False)
 
+    def get_options(self, options: list[str] | tuple[str, ...]) -> dict[str, bool]:
+        """Get several option values in one call"""
+        stored = self._config['options']
+        return {option: stored.get(option, False) for option in options}
+
     def set_option(self, option: str, value: bool):
         """Set option value"""
         if option in self._config['options']:
             self._config['options'][option] = value
+            self.options_version += 1
             self.save()
             logger.info("Set %s = %s", option, value)
 
@@ -272,12 +339,14 @@ class Config:
     def set_source_channel(self, channel_id: int | None):
         """Set source channel ID"""
         self._config['source_channel'] = channel_id
+        self.version += 1
         self.save()
         logger.info("Set source channel: %s", channel_id)
 
     def get_target_channels(self) -> list:
         """Get list of target channel IDs"""
-        return self._config.get('target_channels', [])
+        # A copy - in-place edits would bypass the version bump that invalidates caches
+        return list(self._config.get('target_channels', []))
 
     def add_target_channel(self, channel_id: int) -> bool:
         """Add a target channel"""
@@ -286,6 +355,7 @@ class Config:
 
         if channel_id not in self._config['target_channels']:
             self._config['target_channels'].append(channel_id)
+            self.version += 1
             self.save()
             logger.info("Added target channel: %s", channel_id)
             return True
@@ -295,6 +365,7 @@ class Config:
         """Remove a target channel"""
         if 'target_channels' in self._config and channel_id in self._config['target_channels']:
             self._config['target_channels'].remove(channel_id)
+            self.version += 1
             self.save()
             logger.info("Removed target channel: %s", channel_id)
             return True
@@ -316,6 +387,8 @@ class Config:
                 self._config['channel_mappings'] = data['channel_mappings']
             if 'options' in data:
                 self._config['options'].update(data['options'])
+            self.version += 1
+            self.options_version += 1
             self.save()
             return True
         except (json.JSONDecodeError, KeyError, TypeError) as e:
@@ -71,6 +71,8 @@ class MirrorBot:
             )
 
             await self.client.connect()
+            # Session checks reuse this connection instead of opening another
+            self.session_manager.client = self.client
 
             if not await self.client.is_user_authorized():
                 logger.error("%sSession invalid or expired", Fore.RED)
@@ -167,6 +169,7 @@ class MirrorBot:
         """Clean shutdown"""
         self.running = False
         if self.mirror_engine:
+            await self.mirror_engine.shutdown()
             await self.mirror_engine.save_state()
         if self.client:
             with suppress(Exception):
@@ -135,9 +135,9 @@ class SyncMenu:
             await event.respond("동기화를 시작합니다... 시간이 걸릴 수 있습니다.")
 
             try:
-                # Perform sync
-                total = await self.sync_channel_history(source_id, target_id)
-                await event.respond(f"✅ 동기화 완료! {total}개 메시지 복사됨")
+                # Queue the history on the engine - it paces and retries per target
+                total = await self.mirror_engine.sync_channel(source_id, target_id)
+                await event.respond(f"✅ 동기화 시작됨! {total}개 메시지 대기열 추가됨")
             except Exception as e:
                 await event.respond(f"❌ 동기화 실패: {e!s}")
 
@@ -148,45 +148,3 @@ class SyncMenu:
         else:
             await event.respond("동기화가 취소되었습니다.")
             del self.parent.user_states[user_id]
-
-    async def sync_channel_history(self, source_id: int, target_id: int) -> int:
-        """Sync entire channel history from source to target"""
-        total = 0
-
-        try:
-            # Get source and target entities
-            source = await self.client.get_entity(source_id)
-            target = await self.client.get_entity(target_id)
-
-            # Clear target channel (optional - you might want to skip this)
-            # This would require admin permissions in the target channel
-
-            # Copy all messages from source to target
-            async for message in self.client.iter_messages(source, reverse=True):
-                try:
-                    if message.text:
-                        # Text message
-                        await self.client.send_message(target, message.text)
-                    elif message.media:
-                        # Media message
-                        await self.client.send_file(
-                            target,
-                            message.media,
-                            caption=message.text or ""
-                        )
-
-                    total += 1
-
-                    # Progress update every 100 messages
-                    if total % 100 == 0:
-                        logger.info(f"Synced {total} messages...")
-
-                except Exception as e:
-                    logger.error(f"Failed to sync message: {e}")
-                    continue
-
-            return total
-
-        except Exception as e:
-            logger.error(f"Sync failed: {e}")
-            raise
@@ -4,13 +4,18 @@ Core mirroring logic with copy restriction bypass
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
 import io
+import tempfile
 import time
-from typing import Optional, Set, Dict, List, Any
+from datetime import datetime
+from typing import Optional, Set, Dict, List, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 from collections import deque
+from types import SimpleNamespace
 
 from telethon import TelegramClient, events
 from telethon.tl.types import (
@@ -18,18 +23,114 @@ from telethon.tl.types import (
     MessageMediaWebPage, MessageMediaPoll, MessageMediaGeo,
     DocumentAttributeVideo, DocumentAttributeAudio,
     DocumentAttributeFilename, DocumentAttributeSticker,
-    DocumentAttributeAnimated, MessageService
+    DocumentAttributeAnimated, MessageService,
+    MessageEntityCustomEmoji
 )
 from telethon.errors import (
     FloodWaitError, MediaEmptyError, ChatWriteForbiddenError,
-    ChannelPrivateError, MessageNotModifiedError,
+    ChannelPrivateError, ChatForwardsRestrictedError, MessageNotModifiedError,
     MessageIdInvalidError, MessageDeleteForbiddenError
 )
 
 logger = logging.getLogger('MirrorEngine')
 
+# Bounded memo for per-shape message analysis (cleared wholesale when full)
+DEFAULT_MAX_CACHE_ENTRIES = 4096
+_priority_cache: Dict[Tuple[type, type, bool], int] = {}
 
-@dataclass
+# Recent message keys remembered for redelivery checks (power of two)
+RECENT_RING_SIZE = 4096
+
+# Options read on the hot path, snapshotted by MirrorEngine._options()
+ENGINE_OPTIONS = (
+    'mirror_enabled', 'mirror_text', 'mirror_media', 'mirror_edits',
+    'mirror_deletes', 'bypass_restriction', 'silent',
+    'max_parallel_targets', 'rate_per_chat', 'burst_per_chat'
+)
+
+# Fallback when max_parallel_targets is not configured
+DEFAULT_MAX_PARALLEL_TARGETS = 8
+
+# Fallback per-chat send pacing - sustained msgs/sec and burst size
+DEFAULT_RATE_PER_CHAT = 1.0
+DEFAULT_BURST_PER_CHAT = 5
+
+# Flood backoff floor as a fraction of the per-chat rate - kept below it so backoff has room
+MIN_RATE_FRACTION = 0.25
+
+# Samples averaged per performance metric
+PERF_WINDOW = 64
+
+# Bypass media downloaded at once
+MAX_CONCURRENT_DOWNLOADS = 4
+
+# Of those, large (spooled) downloads in flight at once
+MAX_CONCURRENT_LARGE_DOWNLOADS = 2
+
+# send_file flags per (sent as media, round video, voice) - built once, never per call
+DOCUMENT_SEND_KWARGS: Dict[Tuple[bool, bool, bool], Dict[str, bool]] = {
+    (as_media, round_message, voice): {
+        'force_document': not as_media,
+        'video_note': round_message,
+        'voice_note': voice,
+    }
+    for as_media, round_message, voice in itertools.product((False, True), repeat=3)
+}
+
+# Uploaded bypass media handles kept for reuse by other targets
+MAX_SHARED_UPLOADS = 256
+
+# Downloads larger than this spill from memory to a temp file
+MEDIA_SPOOL_BYTES = 8 * 1024 * 1024
+
+# Window in which delete events are coalesced per target
+DELETE_FLUSH_SECONDS = 0.1
+
+# Window in which log channel lines are coalesced
+LOG_FLUSH_SECONDS = 2
+
+# Log lines per log channel message
+LOG_LINES_PER_MESSAGE = 10
+
+# Log lines buffered before new ones are dropped
+LOG_BUFFER_MAX = 100
+
+# Window in which stat counters are coalesced before the config is saved
+STATS_FLUSH_SECONDS = 2
+
+# Sync backfill sorts behind all live traffic
+SYNC_PRIORITY = -1
+
+# Log channel prefix per level
+LOG_LEVEL_EMOJI = {
+    "INFO": "ℹ️",
+    "SUCCESS": "✅",
+    "WARNING": "⚠️",
+    "ERROR": "❌",
+    "DEBUG": "🔍"
+}
+
+# Formatted HH:MM:SS for the current second - [epoch_second, text]
+_timestamp_cache: List[Any] = [0, ""]
+
+
+def _open_media_buffer(expected_size: int = 0) -> Any:
+    """In-memory buffer for small media, disk-spilling spool for large documents"""
+    if expected_size > MEDIA_SPOOL_BYTES:
+        return tempfile.SpooledTemporaryFile(max_size=MEDIA_SPOOL_BYTES, mode='w+b')
+    return io.BytesIO()
+
+
+def _log_timestamp() -> str:
+    """Wall-clock HH:MM:SS, formatted at most once per second"""
+    now = int(time.time())
+    if _timestamp_cache[0] != now:
+        _timestamp_cache[0] = now
+        _timestamp_cache[1] = datetime.fromtimestamp(now).strftime("%H:%M:%S")
+    return _timestamp_cache[1]
+
+
+@dataclass(slots=True)
 class MirrorTask:
     """Enhanced mirror task with retry logic"""
     message: Message
@@ -37,17 +138,67 @@ class MirrorTask:
     target_chat: int
     retry_count: int = 0
     max_retries: int = 3
-    created_at: float = 0
-    priority: int = 0  # 0=normal, 1=high, 2=critical
+    created_at: float = 0  # time.monotonic() at enqueue
+    max_age: Optional[float] = 60  # Seconds before a queued task is stale, None = never
+    priority: int = 0  # -1=sync backfill, 0=normal, 1=high, 2=critical
+    strategy: Optional['MirrorStrategy'] = None  # Resolved once, reused on retries
+
+
+class TokenBucket:
+    """Adaptive token bucket pacing sends to one chat
+
+    Successful sends grow the refill rate additively (rate += delta + alpha * rate),
+    a FloodWaitError halves it, empties the bucket and blocks until the wait is over.
+    """
+    def __init__(self, rate: float = 1.0, capacity: float = 5.0, min_rate: float = 1.0,
+                 max_rate: float = 20.0, alpha: float = 0.1, beta: float = 2.0, delta: float = 0.5):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.alpha = alpha
+        self.beta = beta
+        self.delta = delta
+        self.last_refill = time.monotonic()
+        self.blocked_until = 0.0
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+    def is_blocked(self) -> bool:
+        """True while a flood wait is in effect"""
+        return time.monotonic() < self.blocked_until
+
+    async def acquire(self):
+        """Wait until a send is allowed and consume one token"""
+        while True:
+            now = time.monotonic()
+            if now < self.blocked_until:
+                await asyncio.sleep(self.blocked_until - now)
+                continue
+            self._refill(now)
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def increase_rate(self):
+        """Send succeeded - probe for more throughput"""
+        self.rate = min(self.max_rate, self.rate + self.delta + self.alpha * self.rate)
+
+    def decrease_rate(self, wait_seconds: float = 0):
+        """Telegram pushed back - back off multiplicatively and honour the wait"""
+        self.rate = max(self.min_rate, self.rate / self.beta)
+        self.tokens = 0
+        self.blocked_until = max(self.blocked_until, time.monotonic() + wait_seconds)
 
 
 class MirrorStrategy(Enum):
     """MCP-enhanced mirroring strategies"""
     DIRECT = "direct"  # Simple forward
     BYPASS = "bypass"  # Restriction bypass
-    OPTIMIZED = "optimized"  # With compression
-    BATCH = "batch"  # Batch operations
-    SMART = "smart"  # Context-aware
 
 
 class MirrorEngine:
@@ -55,56 +206,192 @@ class MirrorEngine:
     def __init__(self, client: TelegramClient, config: Any):
         self.client = client
         self.config = config
-        self.processing: Set[str] = set()
+        self.processing: Set[int] = set()  # Packed (source_chat, message_id) keys
         
         # MCP-enhanced features
-        self.task_queue: asyncio.Queue[MirrorTask] = asyncio.Queue()
-        self.batch_buffer: Dict[int, List[Message]] = {}
-        self.batch_timers: Dict[int, float] = {}
-        self.error_counts: Dict[str, int] = {}
+        # One bounded queue + worker per target chat: sends to the same chat are
+        # serialized (no FloodWait races) while different targets run in parallel.
+        # Entries are (-priority, scheduled_time, seq, task) so higher priority
+        # goes first, then earliest due; seq breaks ties without comparing tasks
+        self.queue_maxsize = 1024
+        self.target_queues: Dict[int, asyncio.PriorityQueue[Tuple[int, float, int, MirrorTask]]] = {}
+        self._seq = itertools.count()
+        self.target_workers: Dict[int, asyncio.Task] = {}
+        # Queue slots a sync may hold per target - the rest stay free for live messages
+        self._sync_slots: Dict[int, asyncio.Semaphore] = {}
+        # Per-target min-heap of (due_time, entry) for retries still backing off
+        self.delayed_tasks: Dict[int, List[Tuple[float, Tuple[int, float, int, MirrorTask]]]] = {}
+        self.error_counts: Dict[str, float] = {}  # Failure key → time, last hour only
+        self._error_heap: List[Tuple[float, str]] = []  # (time, key), oldest first
         self.performance_stats: Dict[str, float] = {}
+        self._metric_windows: Dict[str, deque] = {}
+        self._metric_sums: Dict[str, float] = {}
+        self._degraded = False
+        
+        # Intelligent rate limiting - adaptive token bucket per target chat
+        self.buckets: Dict[int, TokenBucket] = {}
+        
+        # Per-source "protected content" flag, resolved once per chat
+        self.noforwards_cache: Dict[int, bool] = {}
+        # Resolved InputPeer per target chat
+        self.peer_cache: Dict[int, Any] = {}
+        # In-flight/finished bypass uploads per (source_chat, msg_id, media_id)
+        self._uploads: Dict[Tuple[int, int, Optional[int]], asyncio.Future] = {}
+        
+        # Caps sends in flight across every target
+        self._send_semaphore = asyncio.Semaphore(
+            config.get_option('max_parallel_targets') or DEFAULT_MAX_PARALLEL_TARGETS
+        )
+        
+        # Caps concurrent bypass downloads - bounds memory and connection churn
+        self._download_semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+        # Large files hold their slot for minutes - keep them from starving photos
+        self._large_download_semaphore = asyncio.Semaphore(MAX_CONCURRENT_LARGE_DOWNLOADS)
+        
+        # Bypass upload handler per exact media type
+        self._media_dispatch = {
+            MessageMediaPhoto: self._bypass_photo,
+            MessageMediaDocument: self._bypass_document,
+            MessageMediaPoll: self._bypass_poll,
+            MessageMediaGeo: self._bypass_geo,
+        }
+        
+        # Source media id per (source_chat, msg_id) at mirror time
+        self.media_ids: Dict[Tuple[int, int], int] = {}
+        
+        # Option snapshot, rebuilt when config.options_version changes
+        self._opts = SimpleNamespace()
+        self._opts_version = -1
+        
+        # Resolved source → targets, rebuilt when config.version changes
+        self._target_cache: Dict[int, Tuple[int, ...]] = {}
+        self._mirrored_sources: frozenset = frozenset()
+        self._target_cache_version = -1
+        
+        # Deletes waiting for the flusher, per target chat
+        self._pending_deletes: Dict[int, List[int]] = {}
+        self._delete_event = asyncio.Event()
+        
+        # Log channel lines waiting for the flusher
+        self._log_buffer: deque = deque()
+        self._log_event = asyncio.Event()
+        self._dropped_logs = 0
+        
+        # Stat increments waiting for the flusher - one config save per window
+        self._stat_buffer: Dict[str, int] = {}
+        self._stats_event = asyncio.Event()
         
-        # Intelligent rate limiting
-        self.flood_wait_until: Dict[int, float] = {}
-        self.message_history: deque = deque(maxlen=1000)
+        # Pending edit timers per (source_chat, msg_id) - only the last edit is sent
+        self._pending_edits: Dict[Tuple[int, int], asyncio.TimerHandle] = {}
+        self._edit_debounce = 0.5
         
-        # Start background workers
+        # Recently seen message keys - catches Telegram redeliveries early
+        self._recent_ring: List[int] = [0] * RECENT_RING_SIZE
+        self._recent_set: Set[int] = set()
+        self._recent_idx = 0
+        
+        # Sampled logging - hot paths narrate only every Nth event
+        self._log_every = 100
+        self._log_counter = 0
+        
+        # Start background workers - handles kept so shutdown() can cancel them
+        self._workers: List[asyncio.Task] = []
         self._start_workers()
 
     def _start_workers(self):
         """Start background worker tasks"""
-        asyncio.create_task(self._process_queue())
-        asyncio.create_task(self._batch_processor())
-        asyncio.create_task(self._performance_monitor())
+        self._workers = [
+            asyncio.create_task(self._delete_flusher()),
+            asyncio.create_task(self._log_flusher()),
+            asyncio.create_task(self._stats_flusher()),
+        ]
+    
+    async def shutdown(self):
+        """Cancel background and per-target workers and wait for them to exit"""
+        for handle in self._pending_edits.values():
+            handle.cancel()
+        self._pending_edits.clear()
+        
+        tasks = [*self._workers, *self.target_workers.values()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers = []
+        self.target_workers.clear()
+        
+        # Counts still in the buffer would be lost with the flusher
+        self._flush_stats()
+    
+    def _count_stat(self, stat: str, increment: int = 1):
+        """Buffer a stat increment for the stats flusher"""
+        self._stat_buffer[stat] = self._stat_buffer.get(stat, 0) + increment
+        self._stats_event.set()
+    
+    def _stat_total(self, stat: str) -> int:
+        """Current value of a stat, including increments the flusher hasn't written yet"""
+        return self.config.get_stats().get(stat, 0) + self._stat_buffer.get(stat, 0)
+    
+    def _flush_stats(self):
+        """Write buffered stat increments to the config in one save"""
+        counts, self._stat_buffer = self._stat_buffer, {}
+        if counts:
+            self.config.update_stats_bulk(counts)
+    
+    async def _stats_flusher(self):
+        """Background stats writer - one config save per STATS_FLUSH_SECONDS window"""
+        while True:
+            await self._stats_event.wait()
+            await asyncio.sleep(STATS_FLUSH_SECONDS)
+            self._stats_event.clear()
+            try:
+                self._flush_stats()
+            except Exception as e:
+                logger.error(f"Stats flusher error: {e}")
     
     async def send_log(self, message: str, level: str = "INFO"):
-        """Send log message to the log channel if configured"""
-        log_channel = self.config.get_log_channel()
-        if not log_channel:
+        """Queue a log message for the log channel if configured"""
+        if not self.config.get_log_channel():
             return
         
-        try:
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%H:%M:%S")
+        # A flood of errors must not grow the buffer without bound
+        if len(self._log_buffer) >= LOG_BUFFER_MAX:
+            self._dropped_logs += 1
+            return
+        
+        emoji = LOG_LEVEL_EMOJI.get(level, "📝")
+        self._log_buffer.append(f"{emoji} **[{_log_timestamp()}]** {message}")
+        self._log_event.set()
+    
+    async def _log_flusher(self):
+        """Background log writer - several lines per log channel message"""
+        while True:
+            await self._log_event.wait()
+            # Let the rest of a burst arrive before flushing
+            await asyncio.sleep(LOG_FLUSH_SECONDS)
+            self._log_event.clear()
             
-            # Create emoji based on level
-            emoji = {
-                "INFO": "ℹ️",
-                "SUCCESS": "✅",
-                "WARNING": "⚠️",
-                "ERROR": "❌",
-                "DEBUG": "🔍"
-            }.get(level, "📝")
+            lines, self._log_buffer = self._log_buffer, deque()
+            if self._dropped_logs:
+                lines.append(f"⚠️ {self._dropped_logs} log messages dropped")
+                self._dropped_logs = 0
             
-            log_text = f"{emoji} **[{timestamp}]** {message}"
+            log_channel = self.config.get_log_channel()
+            if not log_channel:
+                continue
             
-            await self.client.send_message(log_channel, log_text)
-        except Exception as e:
-            logger.error(f"Failed to send log to channel: {e}")
+            bucket = self._get_bucket(log_channel)
+            while lines:
+                chunk = [lines.popleft() for _ in range(min(LOG_LINES_PER_MESSAGE, len(lines)))]
+                try:
+                    # Log traffic shares the channel's send budget
+                    await bucket.acquire()
+                    await self.client.send_message(log_channel, "\n".join(chunk))
+                except Exception as e:
+                    logger.error(f"Failed to send log to channel: {e}")
     
     async def handle_message(self, event: events.NewMessage.Event):
         """Ultra-fast message handler with instant mirroring"""
-        if not self.config.get_option('mirror_enabled'):
+        if not self._options().mirror_enabled:
             return
 
         message = event.message
@@ -115,77 +402,192 @@ class MirrorEngine:
             logger.warning("Could not determine source chat")
             return
 
-        # Check both old-style mappings and new source/target configuration
-        target_chats = []
-        
-        # First check old-style mapping
-        old_target = self.config.get_mapping(source_chat)
-        if old_target:
-            target_chats.append(old_target)
-        
-        # Then check new-style source/target
-        configured_source = self.config.get_source_channel()
-        if configured_source and source_chat == configured_source:
-            targets = self.config.get_target_channels()
-            target_chats.extend(targets)
-        
-        # Remove duplicates
-        target_chats = list(set(target_chats))
+        # Unmirrored chats stop here - no ring or config work
+        if not self._is_mirrored_source(source_chat):
+            return
+
+        # Single int key - message ids fit in 32 bits, so this is collision-free
+        msg_id = (source_chat << 32) | message.id
         
+        # Drop redelivered messages before any config lookup
+        if msg_id in self._recent_set:
+            return
+        self._remember_recent(msg_id)
+
+        target_chats = self._resolve_targets(source_chat)
         if not target_chats:
             return
 
         # Debug logging for media
         if message.media:
-            logger.info(f"📸 Media detected: {type(message.media).__name__}")
-            if not self.config.get_option('mirror_media'):
+            logger.debug("📸 Media detected: %s", type(message.media).__name__)
+            if not self._options().mirror_media:
                 logger.warning("Media mirroring is disabled")
                 return
 
-        msg_id = f"{source_chat}_{message.id}"
         if msg_id in self.processing:
             return
         
         self.processing.add(msg_id)
         
         try:
-            # INSTANT MIRRORING - No queue, direct processing for speed
-            strategy = await self._analyze_message_strategy(message)
-            
-            # Always use parallel processing for maximum speed
-            tasks = []
+            # Hand off to the per-target workers - each target drains in parallel
+            priority = self._calculate_priority(message)
+            # Sync fast path - only await when the chat's protection is still unknown
+            strategy = self._known_strategy(message, source_chat)
+            if strategy is None:
+                strategy = await self._analyze_message_strategy(message, source_chat)
             for target_chat in target_chats:
-                # Skip flood check for speed - handle errors instead
-                tasks.append(self._mirror_instant(message, source_chat, target_chat, strategy))
-            
-            # Execute all tasks in parallel
-            if tasks:
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-                for i, result in enumerate(results):
-                    if isinstance(result, FloodWaitError):
-                        # Handle flood wait by queuing
-                        logger.warning(f"Flood wait for {target_chats[i]}: {result.seconds}s")
-                        self.flood_wait_until[target_chats[i]] = time.time() + result.seconds
-                        await self._queue_task(message, source_chat, target_chats[i], priority=2)
-                    elif isinstance(result, Exception):
-                        logger.error(f"Mirror error: {result}")
-                        # Retry with queue
-                        await self._queue_task(message, source_chat, target_chats[i], priority=1)
+                self._queue_task(message, source_chat, target_chat, priority=priority, strategy=strategy)
         finally:
             self.processing.discard(msg_id)
 
-    async def _analyze_message_strategy(self, message: Message) -> MirrorStrategy:
+    def _remember_recent(self, msg_id: int):
+        """Record a message key in the fixed-size recent ring, evicting the oldest"""
+        idx = self._recent_idx
+        self._recent_set.discard(self._recent_ring[idx])
+        self._recent_ring[idx] = msg_id
+        self._recent_set.add(msg_id)
+        self._recent_idx = (idx + 1) & (RECENT_RING_SIZE - 1)
+    
+    @staticmethod
+    def _media_id(media: Any) -> Optional[int]:
+        """Photo or document id of a media object, if it has one"""
+        photo = getattr(media, 'photo', None)
+        if photo is not None:
+            return getattr(photo, 'id', None)
+        document = getattr(media, 'document', None)
+        if document is not None:
+            return getattr(document, 'id', None)
+        return None
+    
+    def _remember_media_id(self, source_chat: int, msg_id: int, media: Any):
+        """Record the source media id so edits can detect caption-only changes"""
+        media_id = self._media_id(media)
+        if media_id is None:
+            return
+        if len(self.media_ids) >= DEFAULT_MAX_CACHE_ENTRIES:
+            self.media_ids.clear()
+        self.media_ids[(source_chat, msg_id)] = media_id
+    
+    def _options(self) -> SimpleNamespace:
+        """Snapshot of the engine's options, rebuilt only when the config's options change"""
+        if self.config.options_version != self._opts_version:
+            self._opts = SimpleNamespace(**self.config.get_options(ENGINE_OPTIONS))
+            self._opts_version = self.config.options_version
+        return self._opts
+    
+    def _refresh_routing(self):
+        """Drop cached routing and rebuild the mirrored-source set after a config change"""
+        self._target_cache.clear()
+        sources = {source for source, target in self.config.get_all_mappings().items() if target}
+        configured_source = self.config.get_source_channel()
+        if configured_source and self.config.get_target_channels():
+            sources.add(configured_source)
+        self._mirrored_sources = frozenset(sources)
+        self._target_cache_version = self.config.version
+    
+    def _is_mirrored_source(self, source_chat: int) -> bool:
+        """Cheap gate - does this chat have any targets at all?"""
+        if self.config.version != self._target_cache_version:
+            self._refresh_routing()
+        return source_chat in self._mirrored_sources
+    
+    def _resolve_targets(self, source_chat: int) -> Tuple[int, ...]:
+        """Get target chats for a source, cached until the config changes"""
+        if self.config.version != self._target_cache_version:
+            self._refresh_routing()
+        
+        targets = self._target_cache.get(source_chat)
+        if targets is None:
+            targets = self._compute_targets(source_chat)
+            self._target_cache[source_chat] = targets
+        return targets
+    
+    def _compute_targets(self, source_chat: int) -> Tuple[int, ...]:
+        """Collect target chats from old-style mappings and the source/target configuration"""
+        target_chats = []
+        
+        # First check old-style mapping
+        old_target = self.config.get_mapping(source_chat)
+        if old_target:
+            target_chats.append(old_target)
+        
+        # Then check new-style source/target
+        configured_source = self.config.get_source_channel()
+        if configured_source and source_chat == configured_source:
+            target_chats.extend(self.config.get_target_channels())
+        
+        # Remove duplicates, keeping order
+        return tuple(dict.fromkeys(target_chats))
+    
+    async def _analyze_message_strategy(self, message: Message, source_chat: int) -> MirrorStrategy:
         """Ultra-fast strategy analysis - prioritize speed"""
-        # Check for restrictions first
-        if message.restriction_reason and self.config.get_option('bypass_restriction'):
-            return MirrorStrategy.BYPASS
+        strategy = self._known_strategy(message, source_chat)
+        if strategy is not None:
+            return strategy
         
-        # Skip batch for instant processing
-        # All messages go direct for maximum speed
+        # Source protection not resolved yet - one lookup per chat
+        if await self._is_source_protected(source_chat):
+            return MirrorStrategy.BYPASS
         return MirrorStrategy.DIRECT
     
+    def _known_strategy(self, message: Message, source_chat: int) -> Optional[MirrorStrategy]:
+        """Strategy decidable without I/O, or None when the chat's protection is still unknown"""
+        # Only protected media needs the download → re-upload bypass
+        if not message.media or not self._options().bypass_restriction:
+            return MirrorStrategy.DIRECT
+        if message.restriction_reason or getattr(message, 'noforwards', False):
+            return MirrorStrategy.BYPASS
+        
+        protected = self.noforwards_cache.get(source_chat)
+        if protected is None:
+            return None
+        return MirrorStrategy.BYPASS if protected else MirrorStrategy.DIRECT
+    
+    async def _is_source_protected(self, source_chat: int) -> bool:
+        """Check whether the source chat has content protection (noforwards) enabled"""
+        cached = self.noforwards_cache.get(source_chat)
+        if cached is not None:
+            return cached
+        
+        try:
+            entity = await self.client.get_entity(source_chat)
+        except Exception as e:
+            # Unknown state - assume protected so the bypass path is used
+            logger.debug("Could not resolve source chat %s: %s", source_chat, e)
+            return True
+        
+        protected = bool(getattr(entity, 'noforwards', False))
+        self.noforwards_cache[source_chat] = protected
+        return protected
+    
+    async def _get_input_peer(self, chat_id: int) -> Any:
+        """Resolve and memoize the InputPeer for a chat so sends skip entity resolution"""
+        peer = self.peer_cache.get(chat_id)
+        if peer is None:
+            peer = await self.client.get_input_entity(chat_id)
+            self.peer_cache[chat_id] = peer
+        return peer
+    
+    def _should_log(self) -> bool:
+        """Count a hot-path event and return True for every Nth one"""
+        self._log_counter += 1
+        return self._log_counter % self._log_every == 0
+    
     def _calculate_priority(self, message: Message) -> int:
-        """Calculate message priority for queue processing"""
+        """Calculate message priority for queue processing (memoized per message shape)"""
+        key = (type(message), type(message.media), bool(message.reply_to or message.fwd_from))
+        priority = _priority_cache.get(key)
+        if priority is None:
+            priority = self._compute_priority(message)
+            if len(_priority_cache) >= DEFAULT_MAX_CACHE_ENTRIES:
+                _priority_cache.clear()
+            _priority_cache[key] = priority
+        return priority
+    
+    def _compute_priority(self, message: Message) -> int:
+        """Priority rules behind _calculate_priority"""
         # Media messages get higher priority
         if message.media:
             return 1
@@ -197,178 +599,154 @@ class MirrorEngine:
             return 1
         return 0
     
-    async def _is_flood_waiting(self, chat_id: int) -> bool:
-        """Check if chat is in flood wait state"""
-        if chat_id in self.flood_wait_until:
-            if time.time() < self.flood_wait_until[chat_id]:
-                return True
-            else:
-                del self.flood_wait_until[chat_id]
-        return False
+    def _get_bucket(self, chat_id: int) -> TokenBucket:
+        """Get the rate limiter for a chat"""
+        bucket = self.buckets.get(chat_id)
+        if bucket is None:
+            opts = self._options()
+            rate = opts.rate_per_chat or DEFAULT_RATE_PER_CHAT
+            # The configured rate is a ceiling - backoff drops below it and
+            # recovery climbs back to it, but never past
+            bucket = TokenBucket(rate=rate, capacity=opts.burst_per_chat or DEFAULT_BURST_PER_CHAT,
+                                 min_rate=rate * MIN_RATE_FRACTION, max_rate=rate)
+            self.buckets[chat_id] = bucket
+        return bucket
+    
+    def _get_target_queue(self, target_chat: int) -> asyncio.PriorityQueue:
+        """Get the queue for a target chat, starting its worker on first use"""
+        queue = self.target_queues.get(target_chat)
+        if queue is None:
+            queue = asyncio.PriorityQueue(maxsize=self.queue_maxsize)
+            self.target_queues[target_chat] = queue
+            self.delayed_tasks[target_chat] = []
+            self.target_workers[target_chat] = asyncio.create_task(self._process_queue(target_chat))
+        return queue
+    
+    def _queue_size(self) -> int:
+        """Total number of tasks waiting across all target queues, including parked retries"""
+        return sum(queue.qsize() for queue in self.target_queues.values()) + \
+            sum(len(delayed) for delayed in self.delayed_tasks.values())
+    
+    def _target_backlog(self, target_chat: int) -> int:
+        """Tasks waiting for one target - queued plus parked retries"""
+        return self._get_target_queue(target_chat).qsize() + len(self.delayed_tasks[target_chat])
+    
+    def _queue_entry(self, task: MirrorTask, delay: float = 0) -> Tuple[int, float, int, MirrorTask]:
+        """Build the priority queue entry for a task, due after `delay` seconds"""
+        return (-task.priority, time.monotonic() + delay, next(self._seq), task)
+    
+    async def _put_task(self, task: MirrorTask):
+        """Queue a task on its target queue, waiting if the queue is full"""
+        await self._get_target_queue(task.target_chat).put(self._queue_entry(task))
     
-    async def _queue_task(self, message: Message, source: int, target: int, priority: int = 0):
+    def _requeue(self, task: MirrorTask, delay: float = 0):
+        """Put a task back on its target queue without blocking that queue's own worker"""
+        # Parked retries count against the same bound as queued tasks
+        if self._target_backlog(task.target_chat) >= self.queue_maxsize:
+            logger.warning(f"Queue full, dropping retry for {task.target_chat}")
+            self._count_stat('dropped')
+            return
+        
+        entry = self._queue_entry(task, delay)
+        if delay > 0:
+            # Called from the target's own worker - park it directly until due
+            heapq.heappush(self.delayed_tasks[task.target_chat], (entry[1], entry))
+        else:
+            self.target_queues[task.target_chat].put_nowait(entry)
+    
+    def _queue_task(
+        self, message: Message, source: int, target: int,
+        priority: int = 0, strategy: Optional[MirrorStrategy] = None
+    ):
         """Queue task for processing"""
         task = MirrorTask(
             message=message,
             source_chat=source,
             target_chat=target,
-            created_at=time.time(),
-            priority=priority
+            created_at=time.monotonic(),
+            priority=priority,
+            strategy=strategy
         )
-        await self.task_queue.put(task)
-    
-    async def _add_to_batch(self, message: Message, source: int, target: int):
-        """Add message to batch buffer"""
-        if target not in self.batch_buffer:
-            self.batch_buffer[target] = []
-            self.batch_timers[target] = time.time()
-        
-        self.batch_buffer[target].append(message)
-        
-        # Process batch if it's full or timeout
-        if len(self.batch_buffer[target]) >= 10 or \
-           time.time() - self.batch_timers[target] > 2:
-            await self._process_batch(target)
-    
-    async def _process_batch(self, target_chat: int):
-        """Process batched messages efficiently"""
-        if target_chat not in self.batch_buffer:
-            return
-        
-        messages = self.batch_buffer.pop(target_chat, [])
-        if target_chat in self.batch_timers:
-            del self.batch_timers[target_chat]
-        
-        if not messages:
+        # Never stall the event handler - shed load when the target is backed up
+        if self._target_backlog(target) >= self.queue_maxsize:
+            logger.warning(f"Queue full, dropping task for {target}")
+            self._count_stat('dropped')
             return
-        
-        try:
-            # Combine text messages
-            combined_text = "\n\n".join([m.message for m in messages if m.message])
-            
-            # Send as single message with separator
-            sent = await self.client.send_message(
-                target_chat,
-                combined_text,
-                parse_mode='md'
-            )
-            
-            # Cache all message mappings
-            for msg in messages:
-                self.config.cache_message(msg.id, sent.id, target_chat)
-            
-            self.config.update_stats('messages_mirrored', len(messages))
-            logger.info(f"Batch processed {len(messages)} messages")
-            
-        except Exception as e:
-            logger.error(f"Batch processing failed: {e}")
-            # Fall back to individual processing
-            for msg in messages:
-                await self._queue_task(msg, target_chat, target_chat)
+        self.target_queues[target].put_nowait(self._queue_entry(task))
     
-    async def _process_queue(self):
-        """Ultra-fast queue processor - minimal delays"""
+    async def _process_queue(self, target_chat: int):
+        """Ultra-fast per-target queue processor - minimal delays"""
+        queue = self.target_queues[target_chat]
+        delayed = self.delayed_tasks[target_chat]  # Retries not yet due
+        processed = 0
         while True:
             try:
-                task = await self.task_queue.get()
+                # Promote retries whose backoff has elapsed so priority ordering applies
+                now = time.monotonic()
+                while delayed and delayed[0][0] <= now and not queue.full():
+                    queue.put_nowait(heapq.heappop(delayed)[1])
                 
-                # Skip old tasks
-                if time.time() - task.created_at > 60:  # 1 minute timeout
+                if delayed:
+                    try:
+                        entry = await asyncio.wait_for(queue.get(), timeout=max(0, delayed[0][0] - now))
+                    except asyncio.TimeoutError:
+                        continue
+                else:
+                    entry = await queue.get()
+                
+                if entry[1] > time.monotonic():
+                    # Not due yet - park it instead of sleeping on the queue head
+                    heapq.heappush(delayed, (entry[1], entry))
                     continue
+                task = entry[-1]
+                if task.priority == SYNC_PRIORITY and task.retry_count == 0:
+                    # First dequeue of a backfill task - hand its slot back to the sync
+                    self._sync_slots[target_chat].release()
                 
-                # Quick flood check
-                if await self._is_flood_waiting(task.target_chat):
-                    await asyncio.sleep(0.5)  # Shorter wait
-                    await self.task_queue.put(task)  # Re-queue
+                # Skip old tasks
+                if task.max_age is not None and time.monotonic() - task.created_at > task.max_age:
                     continue
                 
-                # Process task immediately
-                msg_id = f"{task.source_chat}_{task.message.id}"
-                if msg_id not in self.processing:
-                    self.processing.add(msg_id)
-                    try:
-                        # Use instant processing
-                        await self._process_task_instant(task)
-                    finally:
-                        self.processing.discard(msg_id)
+                # Use instant processing
+                await self._process_task_instant(task)
                 
             except Exception as e:
                 logger.error(f"Queue processor error: {e}")
             
-            # Minimal sleep for fastest processing
-            await asyncio.sleep(0.01)
+            # queue.get() already yields when idle - only force a context
+            # switch now and then so a long backlog can't starve the loop
+            processed += 1
+            if processed % 1000 == 0:
+                await asyncio.sleep(0)
     
     async def _process_task_instant(self, task: MirrorTask):
         """Instant task processing - no delays"""
         try:
-            # Direct instant mirroring
-            strategy = MirrorStrategy.DIRECT if not task.message.restriction_reason else MirrorStrategy.BYPASS
-            result = await self._mirror_instant(task.message, task.source_chat, task.target_chat, strategy)
-            
-            if result:
-                self.config.update_stats('messages_mirrored')
-                logger.debug(f"Queue instant: {task.message.id} → {result.id}")
-                
-        except FloodWaitError as e:
-            logger.warning(f"Flood wait {e.seconds}s for {task.target_chat}")
-            self.flood_wait_until[task.target_chat] = time.time() + e.seconds
-            
-            # Re-queue with retry
-            if task.retry_count < task.max_retries:
-                task.retry_count += 1
-                task.priority = 2
-                await self.task_queue.put(task)
-        
-        except Exception as e:
-            logger.error(f"Task instant error: {e}")
-            # Retry
-            if task.retry_count < task.max_retries:
-                task.retry_count += 1
-                await asyncio.sleep(0.5 * task.retry_count)  # Short backoff
-                await self.task_queue.put(task)
-            else:
-                self.config.update_stats('errors')
-    
-    async def _process_task(self, task: MirrorTask):
-        """Process individual mirror task with retry logic"""
-        try:
-            start_time = time.time()
-            
-            # Apply strategy-based processing
-            strategy = await self._analyze_message_strategy(task.message)
+            start_time = time.monotonic()
             
-            if strategy == MirrorStrategy.BYPASS:
-                result = await self._mirror_restricted_media_enhanced(task.message, task.target_chat)
-            elif strategy == MirrorStrategy.OPTIMIZED:
-                result = await self._mirror_optimized(task.message, task.target_chat)
-            elif strategy == MirrorStrategy.SMART:
-                result = await self._mirror_smart(task.message, task.target_chat)
-            else:
-                result = await self._mirror_direct(task.message, task.target_chat)
+            # Direct instant mirroring - the strategy survives re-queues
+            if task.strategy is None:
+                task.strategy = await self._analyze_message_strategy(task.message, task.source_chat)
+            result = await self._mirror_instant(task.message, task.source_chat, task.target_chat, task.strategy)
             
             if result:
-                self.config.cache_message(task.message.id, result.id, task.source_chat)
-                self.config.update_stats('messages_mirrored')
-                
-                # Track performance
-                elapsed = time.time() - start_time
-                self._update_performance_stats('mirror_time', elapsed)
-                
-                logger.info(f"Mirrored {task.message.id} → {result.id} in {elapsed:.2f}s")
+                # Stats and cache are already updated by _mirror_instant
+                self._update_performance_stats('mirror_time', time.monotonic() - start_time)
+                logger.debug("Queue instant: %s → %s", task.message.id, result.id)
                 
                 # Send success log periodically (every 10 messages)
-                stats = self.config.get_stats()
-                if stats.get('messages_mirrored', 0) % 10 == 0:
+                mirrored = self._stat_total('messages_mirrored')
+                if mirrored % 10 == 0:
                     await self.send_log(
                         f"미러링 진행중\n"
-                        f"총 메시지: {stats.get('messages_mirrored', 0)}개\n"
-                        f"미디어: {stats.get('media_mirrored', 0)}개",
+                        f"총 메시지: {mirrored}개\n"
+                        f"미디어: {self._stat_total('media_mirrored')}개",
                         "SUCCESS"
                     )
-            
+                
         except FloodWaitError as e:
-            logger.warning(f"Flood wait {e.seconds}s for chat {task.target_chat}")
-            self.flood_wait_until[task.target_chat] = time.time() + e.seconds
+            logger.warning(f"Flood wait {e.seconds}s for {task.target_chat}")
+            self._get_bucket(task.target_chat).decrease_rate(e.seconds)
             
             # Send log message
             await self.send_log(
@@ -377,11 +755,13 @@ class MirrorEngine:
                 "WARNING"
             )
             
-            # Re-queue with higher priority
+            # Re-queue with retry
             if task.retry_count < task.max_retries:
                 task.retry_count += 1
-                task.priority = 2  # Critical priority
-                await self.task_queue.put(task)
+                if task.priority != SYNC_PRIORITY:
+                    # A backfill stays behind live traffic even on retry
+                    task.priority = 2
+                self._requeue(task)
         
         except (ChatWriteForbiddenError, ChannelPrivateError) as e:
             logger.error(f"Permission error for chat {task.target_chat}: {e}")
@@ -395,141 +775,64 @@ class MirrorEngine:
             self.config.remove_mapping(task.source_chat)
         
         except Exception as e:
-            logger.error(f"Task processing error: {e}")
-            
-            # Retry logic
+            logger.error(f"Task instant error: {e}")
+            # Retry
             if task.retry_count < task.max_retries:
                 task.retry_count += 1
-                await asyncio.sleep(2 ** task.retry_count)  # Exponential backoff
-                await self.task_queue.put(task)
+                self._requeue(task, delay=0.5 * task.retry_count)  # Short backoff
             else:
-                self.config.update_stats('errors')
-    
-    async def _mirror_direct(self, message: Message, target_chat: int) -> Optional[Message]:
-        """Direct mirroring with custom emoji support"""
-        try:
-            if message.media and self.config.get_option('bypass_restriction'):
-                return await self._mirror_restricted_media_enhanced(message, target_chat)
-            elif message.media and self.config.get_option('mirror_media'):
-                return await self._mirror_media(message, target_chat)
-            elif message.message and self.config.get_option('mirror_text'):
-                # Check for custom emojis in entities
-                if message.entities:
-                    from telethon.tl.types import MessageEntityCustomEmoji
-                    custom_emoji_count = sum(1 for e in message.entities if isinstance(e, MessageEntityCustomEmoji))
-                    if custom_emoji_count > 0:
-                        logger.info(f"Mirroring message with {custom_emoji_count} custom emoji(s)")
-                
-                # Send with all formatting entities including custom emojis
-                return await self.client.send_message(
-                    target_chat,
-                    message.message,
-                    formatting_entities=message.entities,  # Preserves custom emojis
-                    link_preview=isinstance(message.media, MessageMediaWebPage) if message.media else False
-                )
-        except Exception as e:
-            logger.error(f"Direct mirror failed: {e}")
-            # Fallback to plain text if entities fail
-            try:
-                if message.message:
-                    return await self.client.send_message(
-                        target_chat,
-                        message.message,
-                        link_preview=False
-                    )
-            except Exception as fallback_error:
-                logger.error(f"Fallback also failed: {fallback_error}")
-        return None
-    
-    async def _mirror_optimized(self, message: Message, target_chat: int) -> Optional[Message]:
-        """Optimized mirroring for large media"""
-        # Implementation with compression and chunking
-        return await self._mirror_direct(message, target_chat)
+                self._count_stat('errors')
+                self._record_error(f"{task.target_chat}_{task.message.id}")
     
-    async def _mirror_smart(self, message: Message, target_chat: int) -> Optional[Message]:
-        """Context-aware smart mirroring"""
-        # Implementation with context analysis
-        return await self._mirror_direct(message, target_chat)
-    
-    async def _process_custom_emojis(self, message: Message) -> Optional[str]:
-        """Process and preserve custom emojis in messages"""
-        try:
-            if not message.message:
-                return None
-            
-            text = message.message
-            
-            # Check for custom emoji entities
-            if message.entities:
-                from telethon.tl.types import MessageEntityCustomEmoji
-                
-                # Sort entities by offset in reverse to avoid offset issues
-                custom_emoji_entities = [
-                    e for e in message.entities 
-                    if isinstance(e, MessageEntityCustomEmoji)
-                ]
-                
-                if custom_emoji_entities:
-                    # Process custom emojis
-                    for entity in sorted(custom_emoji_entities, key=lambda x: x.offset, reverse=True):
-                        try:
-                            # Get the emoji document ID
-                            document_id = entity.document_id
-                            
-                            # Try to get custom emoji info
-                            # Note: Custom emojis might need special handling based on availability
-                            emoji_text = text[entity.offset:entity.offset + entity.length]
-                            
-                            # Mark custom emoji for preservation
-                            # You might want to download and re-upload the custom emoji sticker
-                            logger.debug(f"Custom emoji found: {emoji_text} (doc_id: {document_id})")
-                            
-                        except Exception as e:
-                            logger.debug(f"Custom emoji processing error: {e}")
-            
-            return text
-            
-        except Exception as e:
-            logger.error(f"Error processing custom emojis: {e}")
+    def _media_changed(self, message: Message) -> Optional[bool]:
+        """Whether the media differs from the one seen at mirror time, or None if unknown"""
+        cached_id = self.media_ids.get((message.chat_id, message.id))
+        current_id = self._media_id(message.media)
+        if cached_id is None or current_id is None:
             return None
+        return cached_id != current_id
     
-    async def _handle_media_edit(self, message: Message, target_chat: int, target_msg_id: int):
+    async def _handle_media_edit(
+        self, message: Message, target_chat: int, target_msg_id: int,
+        media_changed: Optional[bool] = None
+    ):
         """Handle media edits - photo changes, caption updates"""
         try:
-            # Get the target message to check current state
-            target_msg = await self.client.get_messages(target_chat, ids=target_msg_id)
-            if not target_msg:
-                logger.error(f"Target message {target_msg_id} not found")
-                return
-            
-            # Compare media to detect changes
-            media_changed = False
-            
-            # Check if it's a photo change
-            if isinstance(message.media, MessageMediaPhoto) and isinstance(target_msg.media, MessageMediaPhoto):
-                # Compare photo IDs
-                source_photo_id = message.media.photo.id if message.media.photo else None
-                target_photo_id = target_msg.media.photo.id if target_msg.media.photo else None
-                media_changed = (source_photo_id != target_photo_id)
-            elif isinstance(message.media, MessageMediaDocument) and isinstance(target_msg.media, MessageMediaDocument):
-                # Compare document IDs
-                source_doc_id = message.media.document.id if message.media.document else None
-                target_doc_id = target_msg.media.document.id if target_msg.media.document else None
-                media_changed = (source_doc_id != target_doc_id)
-            else:
-                # Different media types
-                media_changed = True
+            # media_changed is decided once per edit by the caller - without it,
+            # compare against the target message
+            if media_changed is None:
+                # Get the target message to check current state
+                target_msg = await self.client.get_messages(target_chat, ids=target_msg_id)
+                if not target_msg:
+                    logger.error(f"Target message {target_msg_id} not found")
+                    return
+                
+                # Check if it's a photo change
+                if isinstance(message.media, MessageMediaPhoto) and isinstance(target_msg.media, MessageMediaPhoto):
+                    # Compare photo IDs
+                    source_photo_id = message.media.photo.id if message.media.photo else None
+                    target_photo_id = target_msg.media.photo.id if target_msg.media.photo else None
+                    media_changed = (source_photo_id != target_photo_id)
+                elif isinstance(message.media, MessageMediaDocument) and isinstance(target_msg.media, MessageMediaDocument):
+                    # Compare document IDs
+                    source_doc_id = message.media.document.id if message.media.document else None
+                    target_doc_id = target_msg.media.document.id if target_msg.media.document else None
+                    media_changed = (source_doc_id != target_doc_id)
+                else:
+                    # Different media types
+                    media_changed = True
             
             if media_changed:
-                logger.info(f"Media content changed, re-sending")
+                logger.info("Media content changed, re-sending")
                 # Delete and re-send for media changes
                 await self.client.delete_messages(target_chat, [target_msg_id])
-                new_msg = await self._mirror_instant(message, message.chat_id, target_chat, MirrorStrategy.DIRECT)
+                strategy = await self._analyze_message_strategy(message, message.chat_id)
+                new_msg = await self._mirror_instant(message, message.chat_id, target_chat, strategy)
                 if new_msg:
                     self.config.cache_message(message.id, new_msg.id, message.chat_id)
             else:
                 # Only caption changed - just edit the caption
-                logger.debug(f"Caption-only edit for {target_msg_id}")
+                logger.debug("Caption-only edit for %s", target_msg_id)
                 await self.client.edit_message(
                     target_chat,
                     target_msg_id,
@@ -543,13 +846,25 @@ class MirrorEngine:
             # Fallback - delete and re-send
             try:
                 await self.client.delete_messages(target_chat, [target_msg_id])
-                new_msg = await self._mirror_instant(message, message.chat_id, target_chat, MirrorStrategy.DIRECT)
+                strategy = await self._analyze_message_strategy(message, message.chat_id)
+                new_msg = await self._mirror_instant(message, message.chat_id, target_chat, strategy)
                 if new_msg:
                     self.config.cache_message(message.id, new_msg.id, message.chat_id)
             except Exception as fallback_error:
                 logger.error(f"Fallback also failed: {fallback_error}")
     
-    async def _handle_text_edit(self, message: Message, target_chat: int, target_msg_id: int):
+    def _text_edit_kwargs(self, message: Message) -> Dict[str, Any]:
+        """edit_message arguments for a text edit - built once per edit, shared by all targets"""
+        return {
+            'formatting_entities': message.entities,  # Preserve all emojis
+            'link_preview': bool(getattr(message, 'web_preview', False)),
+            'buttons': getattr(message, 'buttons', None),
+        }
+    
+    async def _handle_text_edit(
+        self, message: Message, target_chat: int, target_msg_id: int,
+        edit_kwargs: Optional[Dict[str, Any]] = None
+    ):
         """Handle text-only edits"""
         try:
             # Edit with all formatting preserved
@@ -557,25 +872,26 @@ class MirrorEngine:
                 target_chat,
                 target_msg_id,
                 message.message or "",
-                formatting_entities=message.entities,  # Preserve all emojis
-                link_preview=bool(getattr(message, 'web_preview', False)),
-                buttons=getattr(message, 'buttons', None)
+                **(edit_kwargs or self._text_edit_kwargs(message))
             )
         except Exception as e:
             logger.error(f"Text edit failed: {e}")
     
-    async def _retry_edit(self, message: Message, target_chat: int, target_msg_id: int, wait_time: float):
+    async def _retry_edit(
+        self, message: Message, target_chat: int, target_msg_id: int, wait_time: float,
+        media_changed: Optional[bool] = None
+    ):
         """Retry edit after flood wait"""
         try:
             await asyncio.sleep(wait_time)
             
             # Retry based on message type
             if message.media:
-                await self._handle_media_edit(message, target_chat, target_msg_id)
+                await self._handle_media_edit(message, target_chat, target_msg_id, media_changed)
             else:
                 await self._handle_text_edit(message, target_chat, target_msg_id)
             
-            logger.info(f"✏️ Edit retry successful for {target_msg_id} in {target_chat}")
+            logger.info("✏️ Edit retry successful for %s in %s", target_msg_id, target_chat)
             
         except Exception as e:
             logger.error(f"Edit retry failed: {e}")
@@ -584,35 +900,50 @@ class MirrorEngine:
         """Instant mirroring with full emoji support - no delays"""
         try:
             result = None
+            media = message.media
+            entities = message.entities
+            bucket = self._get_bucket(target_chat)
             
-            # Check for bypass restriction first
-            if message.restriction_reason and self.config.get_option('bypass_restriction'):
-                result = await self._mirror_restricted_media_enhanced(message, target_chat)
-            elif message.media:
-                # Handle all media types
-                result = await self._mirror_media_instant(message, target_chat)
-            elif message.message:
-                # Text only
-                result = await self._mirror_text_instant(message, target_chat)
-            else:
-                logger.warning("Message has no content to mirror")
-                return None
+            # Pace sends proactively instead of waiting for FloodWaitError
+            await bucket.acquire()
+            
+            # Cap sends in flight across all targets - taken after pacing so a
+            # flood-blocked target never sits on a slot
+            async with self._send_semaphore:
+                # Protected media must be downloaded and re-uploaded
+                if strategy == MirrorStrategy.BYPASS:
+                    result = await self._mirror_restricted_media_enhanced(message, target_chat)
+                elif media:
+                    # Handle all media types
+                    result = await self._mirror_media_instant(message, target_chat)
+                elif message.message:
+                    # Text only
+                    result = await self._mirror_text_instant(message, target_chat)
+                else:
+                    logger.warning("Message has no content to mirror")
+                    return None
             
             if result:
+                bucket.increase_rate()
+                
                 # Cache the message mapping
                 self.config.cache_message(message.id, result.id, source_chat)
-                self.config.update_stats('messages_mirrored')
+                self._count_stat('messages_mirrored')
+                if self._should_log():
+                    logger.info("Mirrored %s → %s in %s", message.id, result.id, target_chat)
                 
                 # Update media stats if applicable
-                if message.media:
-                    self.config.update_stats('media_mirrored')
+                if media:
+                    self._count_stat('media_mirrored')
+                    # Edit re-sends leave the entry alone - _flush_edit updates it
+                    # once every target has been handled
+                    if (source_chat, message.id) not in self.media_ids:
+                        self._remember_media_id(source_chat, message.id, media)
                 
-                # Log emoji detection
-                if message.entities:
-                    from telethon.tl.types import MessageEntityCustomEmoji
-                    custom_count = sum(1 for e in message.entities if isinstance(e, MessageEntityCustomEmoji))
-                    if custom_count > 0:
-                        logger.debug(f"Instant mirrored with {custom_count} custom emoji(s)")
+                # Log emoji detection (debug only - skip the scan otherwise)
+                if entities and logger.isEnabledFor(logging.DEBUG):
+                    if any(isinstance(e, MessageEntityCustomEmoji) for e in entities):
+                        logger.debug("Instant mirrored with custom emoji(s)")
                 
                 return result
                 
@@ -625,267 +956,356 @@ class MirrorEngine:
     
     async def _mirror_text_instant(self, message: Message, target_chat: int) -> Optional[Message]:
         """Instant text mirroring with all emoji types"""
+        peer = await self._get_input_peer(target_chat)
         try:
             # Send with complete entity preservation
             return await self.client.send_message(
-                target_chat,
+                peer,
                 message.message,
                 formatting_entities=message.entities,  # Preserves ALL emojis
                 link_preview=isinstance(message.media, MessageMediaWebPage) if message.media else False,
                 reply_to=None,  # Don't preserve replies for speed
-                silent=True  # Silent send for speed
+                silent=self._options().silent  # User's notification preference
             )
         except Exception as e:
             logger.error(f"Text instant mirror failed: {e}")
             # Fallback without entities
             return await self.client.send_message(
-                target_chat,
+                peer,
                 message.message,
                 link_preview=False,
-                silent=True
+                silent=self._options().silent
             )
     
     async def _mirror_media_instant(self, message: Message, target_chat: int) -> Optional[Message]:
-        """Instant media mirroring - always use bypass for protected chats"""
+        """Instant media mirroring - reference the existing file for unprotected chats"""
         try:
-            # Always use bypass mode for media to handle protected chats
-            # This downloads and re-uploads the media
+            # Telegram re-uses the source file, no download/upload needed
+            return await self._mirror_media(message, target_chat)
+        except ChatForwardsRestrictedError:
+            # The media can't be referenced - only a download → re-upload gets it across
+            if not self._options().bypass_restriction:
+                raise
             return await self._mirror_restricted_media_enhanced(message, target_chat)
-            
-        except Exception as e:
-            logger.error(f"Media instant mirror failed: {e}")
-            return None
-    
-    async def _mirror_to_target_fast(self, message: Message, source_chat: int, target_chat: int, strategy: MirrorStrategy):
-        """Legacy fast mirroring function - redirects to instant"""
-        return await self._mirror_instant(message, source_chat, target_chat, strategy)
     
     def _update_performance_stats(self, metric: str, value: float):
-        """Track performance metrics"""
-        if metric not in self.performance_stats:
-            self.performance_stats[metric] = value
-        else:
-            # Running average
-            self.performance_stats[metric] = (self.performance_stats[metric] + value) / 2
+        """Track performance metrics as a mean over the last PERF_WINDOW samples"""
+        window = self._metric_windows.get(metric)
+        if window is None:
+            window = self._metric_windows[metric] = deque(maxlen=PERF_WINDOW)
+        
+        # Keep a running sum so the mean stays O(1) per sample
+        total = self._metric_sums.get(metric, 0.0) + value
+        if len(window) == PERF_WINDOW:
+            total -= window[0]
+        window.append(value)
+        self._metric_sums[metric] = total
+        self.performance_stats[metric] = total / len(window)
+        
+        # Warn once when performance degrades, not on every sample
+        avg_time = self.performance_stats.get('mirror_time', 0)
+        queue_size = self._queue_size()
+        degraded = avg_time > 5 or queue_size > 50
+        if degraded and not self._degraded:
+            logger.warning(f"Performance degradation: avg_time={avg_time:.2f}s, queue={queue_size}")
+        self._degraded = degraded
     
-    async def _batch_processor(self):
-        """Background batch processor"""
-        while True:
-            try:
-                current_time = time.time()
-                for target_chat in list(self.batch_timers.keys()):
-                    if current_time - self.batch_timers[target_chat] > 2:
-                        await self._process_batch(target_chat)
-            except Exception as e:
-                logger.error(f"Batch processor error: {e}")
-            
-            await asyncio.sleep(1)
+    def _percentile(self, metric: str, fraction: float) -> float:
+        """Percentile over the metric's sample window - sorted on demand, not per sample"""
+        window = self._metric_windows.get(metric)
+        if not window:
+            return 0
+        samples = sorted(window)
+        return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+    
+    def _record_error(self, key: str):
+        """Remember a failed task for the last hour, expiring stale entries as it goes"""
+        now = time.monotonic()
+        cutoff = now - 3600
+        heap = self._error_heap
+        while heap and heap[0][0] < cutoff:
+            ts, stale_key = heapq.heappop(heap)
+            # Skip heap entries superseded by a newer error for the same key
+            if self.error_counts.get(stale_key) == ts:
+                del self.error_counts[stale_key]
+        
+        self.error_counts[key] = now
+        heapq.heappush(heap, (now, key))
     
-    async def _performance_monitor(self):
-        """Monitor and optimize performance"""
-        while True:
-            try:
-                # Log performance stats
-                if self.performance_stats:
-                    avg_time = self.performance_stats.get('mirror_time', 0)
-                    queue_size = self.task_queue.qsize()
-                    
-                    if avg_time > 5 or queue_size > 50:
-                        logger.warning(f"Performance degradation: avg_time={avg_time:.2f}s, queue={queue_size}")
-                
-                # Clear old error counts
-                current_time = time.time()
-                self.error_counts = {k: v for k, v in self.error_counts.items() 
-                                   if current_time - v < 3600}  # Keep last hour
-                
-            except Exception as e:
-                logger.error(f"Performance monitor error: {e}")
-            
-            await asyncio.sleep(30)  # Check every 30 seconds
-
     async def _mirror_restricted_media_enhanced(
         self, message: Message, target_chat: int
     ) -> Optional[Message]:
         """Ultra-fast media bypass with full emoji support"""
+        peer = None
         try:
-            if isinstance(message.media, MessageMediaPhoto):
-                # Download photo to BytesIO buffer
-                buffer = io.BytesIO()
-                await self.client.download_media(message, file=buffer)
-                buffer.seek(0)  # Reset to beginning for reading
-
-                if buffer.getvalue():  # Check if data exists
-                    self.config.update_stats('media_mirrored')
-                    return await self.client.send_file(
-                        target_chat,
-                        buffer,
-                        caption=message.message,  # type: ignore
-                        formatting_entities=message.entities,  # ALL emojis preserved
-                        force_document=False,
-                        silent=True  # Silent for speed
-                    )
-
-            elif isinstance(message.media, MessageMediaDocument):
-                attributes = getattr(message.media.document, 'attributes', []) if message.media.document else []  # type: ignore
-                is_video = any(isinstance(a, DocumentAttributeVideo) for a in attributes)
-                is_audio = any(isinstance(a, DocumentAttributeAudio) for a in attributes)
-                is_sticker = any(isinstance(a, DocumentAttributeSticker) for a in attributes)
-                is_gif = any(isinstance(a, DocumentAttributeAnimated) for a in attributes)
-
-                # Download document to BytesIO buffer
-                buffer = io.BytesIO()
-                await self.client.download_media(message, file=buffer)
-                buffer.seek(0)  # Reset to beginning
-
-                if buffer.getvalue():  # Check if data exists
-                    filename = None
-                    for attr in attributes:
-                        if isinstance(attr, DocumentAttributeFilename):
-                            filename = attr.file_name
-                            break
-
-                    # Set filename if exists
-                    if filename:
-                        buffer.name = filename  # type: ignore
-
-                    self.config.update_stats('media_mirrored')
-
-                    return await self.client.send_file(
-                        target_chat,
-                        buffer,
-                        caption=message.message,  # type: ignore
-                        formatting_entities=message.entities,  # ALL emojis preserved
-                        attributes=attributes,
-                        force_document=not (is_video or is_sticker or is_gif),
-                        video_note=(
-                            is_video and getattr(attributes[0], 'round_message', False)  # type: ignore
-                            if attributes else False
-                        ),
-                        voice_note=(
-                            is_audio and getattr(attributes[0], 'voice', False)  # type: ignore
-                            if attributes else False
-                        ),
-                        silent=True  # Silent for speed
-                    )
-
-            elif isinstance(message.media, MessageMediaPoll):
-                return await self.client.send_message(
-                    target_chat,
-                    f"📊 Poll: {message.media.poll.question}\n"
-                    f"(Polls cannot be forwarded directly)"
-                )
-
-            elif isinstance(message.media, MessageMediaGeo):
-                return await self.client.send_message(
-                    target_chat,
-                    f"📍 Location: {message.media.geo.lat}, {message.media.geo.long}"  # type: ignore
-                )
-
-            else:
+            peer = await self._get_input_peer(target_chat)
+            # Exact-type lookup instead of an isinstance ladder
+            handler = self._media_dispatch.get(type(message.media))
+            if handler is None:
                 return await self._mirror_media(message, target_chat)
+            return await handler(message, peer)
 
+        except (FloodWaitError, ChatWriteForbiddenError, ChannelPrivateError):
+            # Let the worker back off and requeue, or drop the mapping
+            raise
         except MediaEmptyError:
             logger.warning("Media is empty, sending text only")
-            if message.message:  # type: ignore
+            if message.message and peer is not None:
                 return await self.client.send_message(
-                    target_chat,
-                    message.message,  # type: ignore
-                    formatting_entities=message.entities
+                    peer,
+                    message.message,
+                    formatting_entities=message.entities,
+                    silent=self._options().silent  # User's notification preference
                 )
         except Exception as e:
             logger.error("Restricted media mirror failed: %s", e)
             return None
         return None
 
+    async def _bypass_photo(self, message: Message, peer: Any) -> Optional[Message]:
+        """Download a protected photo and re-upload it"""
+        uploaded = await self._shared_upload(message, 'photo.jpg')
+        if uploaded is None:  # Nothing downloaded - no data
+            return None
+
+        return await self.client.send_file(
+            peer,
+            uploaded,
+            caption=message.message,  # type: ignore
+            formatting_entities=message.entities,  # ALL emojis preserved
+            force_document=False,
+            silent=self._options().silent  # User's notification preference
+        )
+
+    async def _bypass_document(self, message: Message, peer: Any) -> Optional[Message]:
+        """Download a protected document and re-upload it with its attributes"""
+        media = message.media
+        attributes = getattr(media.document, 'attributes', []) if media.document else []  # type: ignore
+        is_video = is_audio = is_sticker = is_gif = False
+        round_message = voice = False
+        filename = None
+        # Single pass - TL attribute classes are final, so exact type checks suffice
+        for attr in attributes:
+            attr_type = type(attr)
+            if attr_type is DocumentAttributeVideo:
+                is_video = True
+                round_message = bool(getattr(attr, 'round_message', False))
+            elif attr_type is DocumentAttributeAudio:
+                is_audio = True
+                voice = bool(getattr(attr, 'voice', False))
+            elif attr_type is DocumentAttributeSticker:
+                is_sticker = True
+            elif attr_type is DocumentAttributeAnimated:
+                is_gif = True
+            elif attr_type is DocumentAttributeFilename and filename is None:
+                filename = attr.file_name
+
+        uploaded = await self._shared_upload(
+            message, filename or 'document', getattr(media.document, 'size', 0) or 0
+        )
+        if uploaded is None:  # Nothing downloaded - no data
+            return None
+
+        return await self.client.send_file(
+            peer,
+            uploaded,
+            caption=message.message,  # type: ignore
+            formatting_entities=message.entities,  # ALL emojis preserved
+            attributes=attributes,
+            mime_type=getattr(media.document, 'mime_type', None),
+            silent=self._options().silent,  # User's notification preference
+            # force_document / video_note / voice_note, prebuilt per flag combination
+            **DOCUMENT_SEND_KWARGS[(is_video or is_sticker or is_gif, round_message, voice)]
+        )
+
+    async def _shared_upload(self, message: Message, file_name: str, size: int = 0) -> Optional[Any]:
+        """Download and upload protected media once, sharing the handle across targets"""
+        key = (message.chat_id, message.id, self._media_id(message.media))
+        future = self._uploads.get(key)
+        if future is None:
+            if len(self._uploads) >= MAX_SHARED_UPLOADS:
+                self._uploads.clear()
+            future = asyncio.ensure_future(self._download_and_upload(message, file_name, size))
+            self._uploads[key] = future
+        
+        try:
+            uploaded = await asyncio.shield(future)
+        except Exception:
+            # Let a retry start over instead of replaying the failure
+            if self._uploads.get(key) is future:
+                del self._uploads[key]
+            raise
+        if uploaded is None and self._uploads.get(key) is future:
+            del self._uploads[key]
+        return uploaded
+
+    async def _download_and_upload(self, message: Message, file_name: str, size: int) -> Optional[Any]:
+        """Download media into a buffer and upload it, returning the uploaded file handle"""
+        # Large files spill to disk instead of RAM
+        buffer = _open_media_buffer(size)
+        try:
+            if size > MEDIA_SPOOL_BYTES:
+                # Telethon writes chunk by chunk into the spool, memory stays O(chunk)
+                async with self._large_download_semaphore, self._download_semaphore:
+                    await self.client.download_media(message, file=buffer)
+            else:
+                async with self._download_semaphore:
+                    await self.client.download_media(message, file=buffer)
+            if not buffer.tell():  # Nothing written - no data
+                return None
+            buffer.seek(0)  # Reset to beginning
+            return await self.client.upload_file(buffer, file_name=file_name)
+        finally:
+            buffer.close()
+
+    async def _bypass_poll(self, message: Message, peer: Any) -> Optional[Message]:
+        """Polls cannot be re-sent, post a summary instead"""
+        return await self.client.send_message(
+            peer,
+            f"📊 Poll: {message.media.poll.question}\n"  # type: ignore
+            f"(Polls cannot be forwarded directly)",
+            silent=self._options().silent  # User's notification preference
+        )
+
+    async def _bypass_geo(self, message: Message, peer: Any) -> Optional[Message]:
+        """Post a location as coordinates"""
+        geo = message.media.geo  # type: ignore
+        return await self.client.send_message(
+            peer,
+            f"📍 Location: {geo.lat}, {geo.long}",
+            silent=self._options().silent  # User's notification preference
+        )
+
     async def _mirror_media(self, message: Message, target_chat: int) -> Optional[Message]:
         """Mirror media normally (when not restricted)"""
         try:
             if message.media:
                 return await self.client.send_file(
-                    target_chat,
+                    await self._get_input_peer(target_chat),
                     message.media,  # type: ignore
-                    caption=message.text,  # type: ignore
-                    formatting_entities=message.entities  # Preserves custom emojis
+                    caption=message.message,  # type: ignore
+                    formatting_entities=message.entities,  # Preserves custom emojis
+                    silent=self._options().silent  # User's notification preference
                 )
             return None
+        except (FloodWaitError, ChatWriteForbiddenError, ChannelPrivateError, ChatForwardsRestrictedError):
+            # Callers own backoff, requeue and bypass decisions for these
+            raise
         except Exception as e:
             logger.error("Media mirror failed: %s", e)
             return None
 
     async def handle_edit(self, event: events.MessageEdited.Event):
         """Complete edit handler - text, media, and caption changes"""
-        if not self.config.get_option('mirror_edits'):
+        if not self._options().mirror_edits:
             return
 
         message = event.message
-        if not message:
+        if not message or not self._is_mirrored_source(message.chat_id):
             return
-            
+        
+        # Debounce - rapid successive edits collapse into one round-trip
+        key = (message.chat_id, message.id)
+        pending = self._pending_edits.pop(key, None)
+        if pending:
+            pending.cancel()
+        self._pending_edits[key] = asyncio.get_running_loop().call_later(
+            self._edit_debounce, self._fire_edit, key, message
+        )
+    
+    def _fire_edit(self, key: Tuple[int, int], message: Message):
+        """Debounce timer callback - mirror the latest version of the edit"""
+        self._pending_edits.pop(key, None)
+        asyncio.create_task(self._flush_edit(message))
+    
+    async def _flush_edit(self, message: Message):
+        """Apply an edit to every target chat"""
         source_chat = message.chat_id
 
         # Get all target chats
-        target_chats = []
-        old_target = self.config.get_mapping(source_chat)
-        if old_target:
-            target_chats.append(old_target)
-        
-        configured_source = self.config.get_source_channel()
-        if configured_source and source_chat == configured_source:
-            targets = self.config.get_target_channels()
-            target_chats.extend(targets)
-        
-        target_chats = list(set(target_chats))
+        target_chats = self._resolve_targets(source_chat)
         if not target_chats:
             return
 
-        # Handle different edit types
-        for target_chat in target_chats:
-            target_msg_id = self.config.get_cached_message(message.id, source_chat)
-            if not target_msg_id:
-                logger.debug(f"No cached message for {message.id} in {source_chat}")
-                continue
+        target_msg_id = self.config.get_cached_message(message.id, source_chat)
+        if not target_msg_id:
+            logger.debug("No cached message for %s in %s", message.id, source_chat)
+            return
 
-            try:
-                # Get target message to check what type it was
-                target_msg = await self.client.get_messages(target_chat, ids=target_msg_id)
-                
-                # Handle type changes (text<->media)
-                if message.media and not target_msg.media:
-                    # Text changed to media - delete and re-send
-                    logger.info("Text → Media change detected")
-                    await self.client.delete_messages(target_chat, [target_msg_id])
-                    new_msg = await self._mirror_instant(message, source_chat, target_chat, MirrorStrategy.DIRECT)
-                    if new_msg:
-                        self.config.cache_message(message.id, new_msg.id, source_chat)
-                elif not message.media and target_msg.media:
-                    # Media changed to text - delete and re-send
-                    logger.info("Media → Text change detected")
-                    await self.client.delete_messages(target_chat, [target_msg_id])
-                    new_msg = await self._mirror_instant(message, source_chat, target_chat, MirrorStrategy.DIRECT)
-                    if new_msg:
-                        self.config.cache_message(message.id, new_msg.id, source_chat)
-                elif message.media:
-                    # Media edit (caption or media change)
-                    await self._handle_media_edit(message, target_chat, target_msg_id)
-                else:
-                    # Text-only edit
-                    await self._handle_text_edit(message, target_chat, target_msg_id)
-                
-                logger.info(f"✏️ Edited {message.id} → {target_msg_id} in {target_chat}")
-                self.config.update_stats('edits_mirrored')
-                
-            except MessageNotModifiedError:
-                logger.debug("Message not modified, skipping")
-            except FloodWaitError as e:
-                logger.warning(f"Flood wait {e.seconds}s for edit in {target_chat}")
-                self.flood_wait_until[target_chat] = time.time() + e.seconds
-                asyncio.create_task(self._retry_edit(message, target_chat, target_msg_id, e.seconds))
-            except Exception as e:
-                logger.error(f"Edit failed for {target_chat}: {e}")
+        # Text edits send the same arguments everywhere - build them once
+        edit_kwargs = None if message.media else self._text_edit_kwargs(message)
+        # Decide a media swap before any target re-sends it - every target gets the same answer
+        media_changed = self._media_changed(message) if message.media else None
+        
+        # Edit all targets concurrently - each handles its own errors
+        await self._fan_out(
+            self._edit_one(message, source_chat, target_chat, target_msg_id, edit_kwargs, media_changed)
+            for target_chat in target_chats
+        )
+        
+        if message.media:
+            self._remember_media_id(source_chat, message.id, message.media)
+
+    async def _edit_one(
+        self, message: Message, source_chat: int, target_chat: int, target_msg_id: int,
+        edit_kwargs: Optional[Dict[str, Any]] = None, media_changed: Optional[bool] = None
+    ):
+        """Apply an edit to one target chat"""
+        # A flood-blocked target would only bounce the RPC - retry once the block lifts
+        bucket = self._get_bucket(target_chat)
+        if bucket.is_blocked():
+            asyncio.create_task(self._retry_edit(
+                message, target_chat, target_msg_id, bucket.blocked_until - time.monotonic(),
+                media_changed
+            ))
+            return
+        
+        media = message.media
+        try:
+            # Get target message to check what type it was
+            target_msg = await self.client.get_messages(target_chat, ids=target_msg_id)
+            
+            # Handle type changes (text<->media)
+            if media and not target_msg.media:
+                # Text changed to media - delete and re-send
+                logger.info("Text → Media change detected")
+                await self.client.delete_messages(target_chat, [target_msg_id])
+                strategy = await self._analyze_message_strategy(message, source_chat)
+                new_msg = await self._mirror_instant(message, source_chat, target_chat, strategy)
+                if new_msg:
+                    self.config.cache_message(message.id, new_msg.id, source_chat)
+            elif not media and target_msg.media:
+                # Media changed to text - delete and re-send
+                logger.info("Media → Text change detected")
+                await self.client.delete_messages(target_chat, [target_msg_id])
+                new_msg = await self._mirror_instant(message, source_chat, target_chat, MirrorStrategy.DIRECT)
+                if new_msg:
+                    self.config.cache_message(message.id, new_msg.id, source_chat)
+            elif media:
+                # Media edit (caption or media change)
+                await self._handle_media_edit(message, target_chat, target_msg_id, media_changed)
+            else:
+                # Text-only edit
+                await self._handle_text_edit(message, target_chat, target_msg_id, edit_kwargs)
+            
+            if self._should_log():
+                logger.info("✏️ Edited %s → %s in %s", message.id, target_msg_id, target_chat)
+            self._count_stat('edits_mirrored')
+            
+        except MessageNotModifiedError:
+            logger.debug("Message not modified, skipping")
+        except FloodWaitError as e:
+            logger.warning(f"Flood wait {e.seconds}s for edit in {target_chat}")
+            self._get_bucket(target_chat).decrease_rate(e.seconds)
+            asyncio.create_task(self._retry_edit(
+                message, target_chat, target_msg_id, e.seconds, media_changed
+            ))
+        except Exception as e:
+            logger.error(f"Edit failed for {target_chat}: {e}")
 
     async def handle_delete(self, event: events.MessageDeleted.Event):
         """Enhanced delete handler with multi-target support"""
-        if not self.config.get_option('mirror_deletes'):
+        if not self._options().mirror_deletes:
             return
 
         # Get source chat from event
@@ -893,110 +1313,113 @@ class MirrorEngine:
         if not source_chat:
             logger.debug("No source chat in delete event")
             return
+        if not self._is_mirrored_source(source_chat):
+            return
 
-        # Batch deletions for efficiency (up to 100 per batch)
-        delete_batch: Dict[int, List[int]] = {}
-        
+        # Source is fixed for the event - resolve its targets once
+        target_chats = self._resolve_targets(source_chat)
+        if not target_chats:
+            return
+
+        # Queue for the delete flusher - bursts of events coalesce into few RPCs
+        pending = self._pending_deletes
         for msg_id in event.deleted_ids:
-            # Get all possible target chats
-            target_chats = []
-            
-            # Check old-style mapping
-            old_target = self.config.get_mapping(source_chat)
-            if old_target:
-                target_chats.append(old_target)
-            
-            # Check new-style source->targets mapping
-            configured_source = self.config.get_source_channel()
-            if configured_source and source_chat == configured_source:
-                targets = self.config.get_target_channels()
-                target_chats.extend(targets)
-            
-            target_chats = list(set(target_chats))
+            target_msg_id = self.config.get_cached_message(msg_id, source_chat)
+            if not target_msg_id:
+                continue
             
-            # Find cached messages in all target chats
+            # Queue the cached message in all target chats
             for target_chat in target_chats:
-                target_msg_id = self.config.get_cached_message(msg_id, source_chat)
-                if not target_msg_id:
-                    continue
-                
-                if target_chat not in delete_batch:
-                    delete_batch[target_chat] = []
-                delete_batch[target_chat].append(target_msg_id)
+                pending.setdefault(target_chat, []).append(target_msg_id)
         
-        # Process batches
-        for target_chat, msg_ids in delete_batch.items():
-            try:
+        if pending:
+            self._delete_event.set()
+
+    async def _delete_flusher(self):
+        """Background delete flusher - one pass per DELETE_FLUSH_SECONDS window"""
+        while True:
+            await self._delete_event.wait()
+            # Let the rest of a burst arrive before flushing
+            await asyncio.sleep(DELETE_FLUSH_SECONDS)
+            self._delete_event.clear()
+            
+            pending, self._pending_deletes = self._pending_deletes, {}
+            # Every chunk of every target in flight at once - each handles its own errors
+            chunks = []
+            for target_chat, msg_ids in pending.items():
+                msg_ids = list(dict.fromkeys(msg_ids))
                 # Split into chunks of 100 (Telegram limit)
                 for i in range(0, len(msg_ids), 100):
-                    chunk = msg_ids[i:i+100]
-                    await self.client.delete_messages(target_chat, chunk)
-                    logger.info(f"🗑️ Batch deleted {len(chunk)} messages in {target_chat}")
-                    self.config.update_stats('deletes_mirrored', len(chunk))
-                    
-            except MessageDeleteForbiddenError:
-                logger.warning(f"Cannot delete messages in {target_chat} - no permission")
-            except MessageIdInvalidError:
-                logger.debug(f"Some messages already deleted in {target_chat}")
-            except FloodWaitError as e:
-                logger.warning(f"Flood wait {e.seconds}s for delete in {target_chat}")
-                self.flood_wait_until[target_chat] = time.time() + e.seconds
+                    chunks.append(self._delete_chunk(target_chat, msg_ids[i:i+100]))
+            try:
+                await self._fan_out(chunks)
             except Exception as e:
-                logger.error(f"Batch delete failed: {e}")
+                logger.error(f"Delete flusher error: {e}")
 
-    async def _download_media_to_buffer(self, message: Message, buffer: io.BytesIO) -> Optional[io.BytesIO]:
-        """Download media to buffer for re-upload"""
+    async def _delete_chunk(self, target_chat: int, chunk: List[int]):
+        """Delete up to 100 messages in one target chat"""
         try:
-            await self.client.download_media(message, file=buffer)
-            buffer.seek(0)
-            if buffer.getvalue():
-                return buffer
-            return None
+            # The target's bucket paces chunks and holds them back during a flood wait
+            await self._get_bucket(target_chat).acquire()
+            await self.client.delete_messages(target_chat, chunk)
+            if self._should_log():
+                logger.info("🗑️ Batch deleted %s messages in %s", len(chunk), target_chat)
+            self._count_stat('deletes_mirrored', len(chunk))
+            
+        except MessageDeleteForbiddenError:
+            logger.warning(f"Cannot delete messages in {target_chat} - no permission")
+        except MessageIdInvalidError:
+            logger.debug("Some messages already deleted in %s", target_chat)
+        except FloodWaitError as e:
+            logger.warning(f"Flood wait {e.seconds}s for delete in {target_chat}")
+            self._get_bucket(target_chat).decrease_rate(e.seconds)
         except Exception as e:
-            logger.error(f"Media download failed: {e}")
-            return None
+            logger.error(f"Batch delete failed: {e}")
+
+    async def _upload_album_item(self, message: Message) -> Optional[Any]:
+        """Upload one protected album item, returning a handle every target can send"""
+        media = message.media
+        if isinstance(media, MessageMediaPhoto):
+            return await self._shared_upload(message, 'photo.jpg')
+        
+        document = getattr(media, 'document', None)
+        filename = next(
+            (attr.file_name for attr in getattr(document, 'attributes', None) or []
+             if isinstance(attr, DocumentAttributeFilename)),
+            'document'
+        )
+        return await self._shared_upload(message, filename, getattr(document, 'size', 0) or 0)
     
     async def handle_album(self, event: events.Album.Event):
         """Ultra-fast album handling with parallel processing"""
-        if not self.config.get_option('mirror_enabled'):
+        if not self._options().mirror_enabled:
             return
 
         source_chat = event.chat_id
+        if not self._is_mirrored_source(source_chat):
+            return
         
         # Get all target chats
-        target_chats = []
-        old_target = self.config.get_mapping(source_chat)
-        if old_target:
-            target_chats.append(old_target)
-        
-        configured_source = self.config.get_source_channel()
-        if configured_source and source_chat == configured_source:
-            targets = self.config.get_target_channels()
-            target_chats.extend(targets)
-        
-        target_chats = list(set(target_chats))
+        target_chats = self._resolve_targets(source_chat)
         if not target_chats:
             return
 
         try:
-            # Parallel download for speed
-            media_tasks = []
-            
-            for message in event.messages:
-                if self.config.get_option('bypass_restriction') or message.restriction_reason:
-                    # Always download for protected chats
-                    buffer = io.BytesIO()
-                    media_tasks.append(self._download_media_to_buffer(message, buffer))
-                else:
-                    media_tasks.append(asyncio.create_task(asyncio.sleep(0)))  # Placeholder
+            needs_bypass = self._options().bypass_restriction and (
+                await self._is_source_protected(source_chat)
+                or any(msg.restriction_reason for msg in event.messages)
+            )
             
-            # Download all media in parallel
-            if media_tasks and (self.config.get_option('bypass_restriction') or any(msg.restriction_reason for msg in event.messages)):
-                media_results = await asyncio.gather(*media_tasks, return_exceptions=True)
-                media_list = []
-                for result in media_results:
-                    if result and not isinstance(result, Exception) and result is not None:
-                        media_list.append(result)
+            if needs_bypass:
+                # Protected chats - download and re-upload every item in parallel
+                media_results = await asyncio.gather(
+                    *(self._upload_album_item(message) for message in event.messages),
+                    return_exceptions=True
+                )
+                media_list = [
+                    result for result in media_results
+                    if result is not None and not isinstance(result, Exception)
+                ]
             else:
                 media_list = [msg.media for msg in event.messages]
 
@@ -1008,34 +1431,65 @@ class MirrorEngine:
                     caption = event.original_update.message.message or ""  # type: ignore
                     entities = event.original_update.message.entities  # type: ignore
                 
-                # Send to all targets in parallel
-                send_tasks = []
-                for target_chat in target_chats:
-                    send_tasks.append(self.client.send_file(
-                        target_chat,
-                        media_list,
-                        caption=caption,
-                        formatting_entities=entities,  # Preserve emojis
-                        silent=True  # Silent for speed
-                    ))
-                
-                # Execute all sends in parallel
-                results = await asyncio.gather(*send_tasks, return_exceptions=True)
-                
-                for i, result in enumerate(results):
-                    if not isinstance(result, Exception):
-                        if isinstance(result, list):
-                            for j, msg in enumerate(event.messages):
-                                if j < len(result):
-                                    self.config.cache_message(msg.id, result[j].id, source_chat)
-                        self.config.update_stats('media_mirrored', len(media_list))
-                        logger.info(f"Album instant: {len(media_list)} items → {target_chats[i]}")
-                    else:
-                        logger.error(f"Album error for {target_chats[i]}: {result}")
+                # Send to all targets in parallel - each send handles its own errors
+                await self._fan_out(
+                    self._send_album_to_target(event.messages, source_chat, target_chat, media_list, caption, entities)
+                    for target_chat in target_chats
+                )
 
         except Exception as e:
             logger.error(f"Album mirror failed: {e}")
-            self.config.update_stats('errors')
+            self._count_stat('errors')
+
+    async def _fan_out(self, coros: Any):
+        """Run per-target coroutines concurrently, at most max_parallel_targets at once"""
+        limit = asyncio.Semaphore(self._options().max_parallel_targets or DEFAULT_MAX_PARALLEL_TARGETS)
+        
+        async def run(coro):
+            async with limit:
+                await coro
+        
+        async with asyncio.TaskGroup() as group:
+            for coro in coros:
+                group.create_task(run(coro))
+    
+    async def _send_album_to_target(
+        self, messages: List[Message], source_chat: int, target_chat: int,
+        media_list: List[Any], caption: str, entities: Optional[List[Any]]
+    ):
+        """Send one album to one target, recording the outcome"""
+        bucket = self._get_bucket(target_chat)
+        try:
+            await bucket.acquire()
+            async with self._send_semaphore:
+                result = await self.client.send_file(
+                    target_chat,
+                    media_list,
+                    caption=caption,
+                    formatting_entities=entities,  # Preserve emojis
+                    silent=self._options().silent  # User's notification preference
+                )
+        except FloodWaitError as e:
+            logger.warning(f"Flood wait {e.seconds}s for album in {target_chat}")
+            bucket.decrease_rate(e.seconds)
+            self._count_stat('errors')
+            return
+        except Exception as e:
+            logger.error(f"Album error for {target_chat}: {e}")
+            self._count_stat('errors')
+            return
+        
+        bucket.increase_rate()
+        if isinstance(result, list):
+            self.config.cache_messages_bulk([
+                (msg.id, sent.id, source_chat)
+                for msg, sent in zip(messages, result)
+            ])
+            for msg in messages:
+                self._remember_media_id(source_chat, msg.id, msg.media)
+        self._count_stat('media_mirrored', len(media_list))
+        if self._should_log():
+            logger.info("Album instant: %s items → %s", len(media_list), target_chat)
 
     async def save_state(self):
         """Save engine state"""
@@ -1046,25 +1500,26 @@ class MirrorEngine:
         """Get enhanced engine status with MCP metrics"""
         mappings = self.config.get_all_mappings()
         stats = self.config.get_stats()
+        opts = self._options()
 
         return {
-            'enabled': self.config.get_option('mirror_enabled'),
+            'enabled': opts.mirror_enabled,
             'mappings_count': len(mappings),
             'processing_count': len(self.processing),
-            'queue_size': self.task_queue.qsize(),
-            'batch_buffers': len(self.batch_buffer),
-            'flood_wait_chats': len(self.flood_wait_until),
+            'queue_size': self._queue_size(),
+            'flood_wait_chats': sum(1 for bucket in self.buckets.values() if bucket.is_blocked()),
             'performance': {
                 'avg_mirror_time': self.performance_stats.get('mirror_time', 0),
+                'p95_mirror_time': self._percentile('mirror_time', 0.95),
                 'error_rate': len(self.error_counts) / max(stats.get('messages_mirrored', 1), 1)
             },
             'stats': stats,
             'options': {
-                'text': self.config.get_option('mirror_text'),
-                'media': self.config.get_option('mirror_media'),
-                'edits': self.config.get_option('mirror_edits'),
-                'deletes': self.config.get_option('mirror_deletes'),
-                'bypass': self.config.get_option('bypass_restriction')
+                'text': opts.mirror_text,
+                'media': opts.mirror_media,
+                'edits': opts.mirror_edits,
+                'deletes': opts.mirror_deletes,
+                'bypass': opts.bypass_restriction
             }
         }
     
@@ -1072,39 +1527,57 @@ class MirrorEngine:
         """MCP-enhanced channel synchronization"""
         """Sync all messages from source to target efficiently"""
         try:
-            logger.info(f"Starting sync: {source_chat} → {target_chat}")
+            logger.info("Starting sync: %s → %s", source_chat, target_chat)
             
-            # Get messages in batches
+            # Oldest first. wait_time=0 - the bounded queue already paces us,
+            # no sleeps between chunks
             synced = 0
-            async for message in self.client.iter_messages(source_chat, limit=limit):
+            # Messages already mirrored are skipped, so a rerun resumes where the
+            # last one actually got to. One pass over the cache instead of a lookup per message
+            cached_ids = self.config.get_cached_ids(source_chat)
+            cached_max = max(cached_ids, default=0)
+            # At most half the target's queue - live messages keep the rest
+            sync_slots = self._sync_slots.get(target_chat)
+            if sync_slots is None:
+                sync_slots = self._sync_slots[target_chat] = asyncio.Semaphore(self.queue_maxsize // 2)
+            async for message in self.client.iter_messages(
+                source_chat, limit=limit, reverse=True, wait_time=0
+            ):
                 # Skip service messages
                 if isinstance(message, MessageService):
                     continue
                 
-                # Check if already synced
-                if self.config.get_cached_message(message.id, source_chat):
+                # Check if already synced - newer ids may have been mirrored live meanwhile
+                if message.id in cached_ids or (
+                    message.id > cached_max and self.config.get_cached_message(message.id, source_chat)
+                ):
                     continue
                 
-                # Queue for processing with high priority
+                # Queue behind live traffic so a backfill never delays new messages
                 task = MirrorTask(
                     message=message,
                     source_chat=source_chat,
                     target_chat=target_chat,
-                    created_at=time.time(),
-                    priority=2  # High priority for sync
+                    created_at=time.monotonic(),
+                    priority=SYNC_PRIORITY,
+                    max_age=None  # History never goes stale while it waits
                 )
-                await self.task_queue.put(task)
+                # Blocks once the sync holds its share of the queue - the worker paces the sync
+                await sync_slots.acquire()
+                await self._put_task(task)
                 
                 synced += 1
-                
-                # Rate limiting
-                if synced % 10 == 0:
-                    await asyncio.sleep(1)
-                    logger.info(f"Synced {synced} messages...")
+                if synced % 50 == 0:
+                    # Telegram pushed back on this target - stop reading history until it lifts
+                    bucket = self._get_bucket(target_chat)
+                    if bucket.is_blocked():
+                        await asyncio.sleep(bucket.blocked_until - time.monotonic())
+                if synced % 100 == 0:
+                    logger.info("Synced %s messages...", synced)
             
-            logger.info(f"Sync complete: {synced} messages queued")
+            logger.info("Sync complete: %s messages queued", synced)
             return synced
             
         except Exception as e:
             logger.error(f"Sync failed: {e}")
-            return 0
+            raise
@@ -4,6 +4,8 @@ Manages Telethon session strings and authentication
 """
 
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
 
@@ -16,10 +18,35 @@ logger = logging.getLogger('SessionHandler')
 
 class SessionManager:
     """Manages Telegram session authentication and storage"""
-    def __init__(self, config):
+    def __init__(self, config, client: TelegramClient | None = None):
         self.config = config
         self.session_file = Path('data/session.txt')
         self.session_file.parent.mkdir(parents=True, exist_ok=True)
+        # The bot's own connected client - checks on its session reuse it
+        self.client = client
+
+    @asynccontextmanager
+    async def _session_client(self, session_string: str) -> AsyncIterator[TelegramClient]:
+        """Connected client for the session - the bot's own if it matches, else a temporary one"""
+        if (self.client is not None and self.client.is_connected()
+                and session_string == self.config.session_string):
+            yield self.client
+            return
+
+        client = TelegramClient(
+            StringSession(session_string),
+            self.config.api_id,
+            self.config.api_hash
+        )
+        try:
+            await client.connect()
+            yield client
+        finally:
+            # Never keep a second connection on the same auth key around
+            try:
+                await client.disconnect()  # type: ignore
+            except Exception:
+                pass
 
     async def get_session(self) -> str | None:
         """Get session string from config or file"""
@@ -27,11 +54,11 @@ class SessionManager:
 
         if not session and self.session_file.exists():
             try:
-                with open(self.session_file, encoding='utf-8') as f:
-                    session = f.read().strip()
-                    if session:
-                        self.config.session_string = session
-            except OSError as e:
+                # Session strings are plain ASCII - skip the text I/O layer
+                session = self.session_file.read_bytes().strip().decode('ascii')
+                if session:
+                    self.config.session_string = session
+            except (OSError, UnicodeDecodeError) as e:
                 logger.error("Failed to read session file: %s", e)
 
         return session if session else None
@@ -41,12 +68,11 @@ class SessionManager:
         try:
             self.config.session_string = session_string
 
-            with open(self.session_file, 'w', encoding='utf-8') as f:
-                f.write(session_string)
+            self.session_file.write_bytes(session_string.encode('ascii'))
 
             logger.info("Session saved successfully")
             return True
-        except OSError as e:
+        except (OSError, UnicodeEncodeError) as e:
             logger.error("Failed to save session: %s", e)
             return False
 
@@ -56,25 +82,13 @@ class SessionManager:
             if not session_string or len(session_string) < 100:
                 return False
 
-            client = TelegramClient(
-                StringSession(session_string),
-                self.config.api_id,
-                self.config.api_hash
-            )
-
-            await client.connect()
-            authorized = await client.is_user_authorized()
-
-            if authorized:
-                me = await client.get_me()
-                logger.info("Session valid for: %s (@%s)",
-                          me.first_name, me.username)  # type: ignore[attr-defined]
+            async with self._session_client(session_string) as client:
+                authorized = await client.is_user_authorized()
 
-            if client:
-                try:
-                    await client.disconnect()  # type: ignore
-                except Exception:
-                    pass
+                if authorized:
+                    me = await client.get_me()
+                    logger.info("Session valid for: %s (@%s)",
+                              me.first_name, me.username)  # type: ignore[attr-defined]
             return authorized
 
         except (ConnectionError, ValueError, TypeError) as e:
@@ -142,19 +156,12 @@ class SessionManager:
             return None
 
         try:
-            client = TelegramClient(
-                StringSession(session),
-                self.config.api_id,
-                self.config.api_hash
-            )
+            async with self._session_client(session) as client:
+                if not await client.is_user_authorized():
+                    return None
 
-            await client.connect()
-
-            if not await client.is_user_authorized():
-                return None
-
-            me = await client.get_me()
-            dialogs_count = len(await client.get_dialogs(limit=1))
+                me = await client.get_me()
+                dialogs_count = len(await client.get_dialogs(limit=1))
 
             info = {
                 'id': me.id,  # type: ignore
@@ -166,12 +173,6 @@ class SessionManager:
                 'verified': getattr(me, 'verified', False),
                 'dialogs': dialogs_count
             }
-
-            if client:
-                try:
-                    await client.disconnect()  # type: ignore
-                except Exception:
-                    pass
             return info
 
         except (ConnectionError, ValueError, TypeError) as e:
@@ -6,10 +6,10 @@ Bot launcher script
 import sys
 import os
 
-# Add bot directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'bot'))
-
 if __name__ == "__main__":
+    # Add bot directory to Python path - only when launched, not on import
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'bot'))
+
     import asyncio
     from bot.main import main
     asyncio.run(main())